@@ -1,7 +1,389 @@
 #!/usr/bin/env python3
 """Score Cruncher - Analyze player scores using lists."""
 
+import math
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+from operator import mul, sub
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+DEFAULT_COMPRESSION = 100
+READ_HINT = 1 << 20
+REPORT_PERCENTILES = (50, 90, 99)
+
+
+class TDigest:
+    """
+    Mergeable t-digest sketch for approximate percentiles.
+
+    Values are buffered and periodically merged into at most a few times
+    `compression` weighted centroids, sized by the arcsine scale function
+    so that the tails stay precise. Memory is bounded by the compression,
+    not by how many values were added, and two digests merge into one.
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION) -> None:
+        """
+        Create an empty digest.
+
+        Args:
+            compression: Accuracy knob; more centroids are kept when higher
+        """
+        if compression < 10:
+            raise ValueError("Compression must be at least 10")
+        self.compression = compression
+        self.buffer_limit = compression * 50
+        self.means: list[float] = []
+        self.weights: list[float] = []
+        self.buffer: list[float] = []
+        self.total_weight = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, values: Sequence[float]) -> None:
+        """
+        Add a chunk of values to the digest.
+
+        Args:
+            values: Values to add
+        """
+        if not values:
+            return
+        self.minimum = min(self.minimum, min(values))
+        self.maximum = max(self.maximum, max(values))
+        self.buffer.extend(values)
+        if len(self.buffer) >= self.buffer_limit:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> None:
+        """
+        Fold another digest into this one.
+
+        Args:
+            other: Digest to merge; it is left unchanged
+        """
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._compress(other.means + other.buffer,
+                       other.weights + [1.0] * len(other.buffer))
+
+    def _scale_limit(self, q: float) -> float:
+        """
+        Return the largest quantile one centroid starting at q may reach.
+
+        Args:
+            q: Quantile where the centroid starts
+
+        Returns:
+            Upper quantile limit for that centroid
+        """
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    def _compress(
+        self,
+        extra_means: Optional[list[float]] = None,
+        extra_weights: Optional[list[float]] = None
+    ) -> None:
+        """
+        Merge buffered values and any extra centroids into the centroids.
+
+        Clusters are cut with bisect over cumulative weights, so the
+        Python-level loop runs once per output centroid, not per value.
+
+        Args:
+            extra_means: Centroid means from another digest
+            extra_weights: Matching centroid weights
+        """
+        means = self.means + self.buffer + (extra_means or [])
+        weights = self.weights + [1.0] * len(self.buffer) + \
+            (extra_weights or [])
+        self.buffer = []
+        if not means:
+            return
+        order = sorted(range(len(means)), key=means.__getitem__)
+        means = [means[i] for i in order]
+        weights = [weights[i] for i in order]
+        cumulative = list(accumulate(weights))
+        moments = list(accumulate(map(mul, means, weights)))
+        total = cumulative[-1]
+        new_means: list[float] = []
+        new_weights: list[float] = []
+        start = 0
+        before = 0.0
+        before_moment = 0.0
+        while start < len(means):
+            limit = total * self._scale_limit(before / total)
+            end = max(bisect_right(cumulative, limit, start) - 1, start)
+            weight = cumulative[end] - before
+            if end == start:
+                new_means.append(means[start])
+            else:
+                new_means.append((moments[end] - before_moment) / weight)
+            new_weights.append(weight)
+            before = cumulative[end]
+            before_moment = moments[end]
+            start = end + 1
+        self.means = new_means
+        self.weights = new_weights
+        self.total_weight = total
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Estimate a percentile by interpolating between centroids.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Estimated value, or None if the digest is empty
+        """
+        if self.buffer:
+            self._compress()
+        if not self.means:
+            return None
+        if percent <= 0:
+            return self.minimum
+        if percent >= 100:
+            return self.maximum
+        target = percent / 100 * self.total_weight
+        previous_mean = self.minimum
+        previous_center = 0.0
+        cumulative = 0.0
+        for mean, weight in zip(self.means, self.weights):
+            center = cumulative + weight / 2
+            if target < center:
+                span = center - previous_center
+                fraction = (target - previous_center) / span if span else 0
+                return previous_mean + (mean - previous_mean) * fraction
+            previous_mean, previous_center = mean, center
+            cumulative += weight
+        span = self.total_weight - previous_center
+        fraction = (target - previous_center) / span if span else 0
+        return previous_mean + (self.maximum - previous_mean) * fraction
+
+
+class ScoreSummary:
+    """
+    Single-pass, mergeable summary of a stream of scores.
+
+    Count, total, min and max are exact; mean and variance are folded in
+    chunk by chunk with Chan's parallel update; percentiles come from a
+    t-digest. State stays constant-size however many scores are added.
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION) -> None:
+        """
+        Create an empty summary.
+
+        Args:
+            compression: t-digest compression for percentile estimates
+        """
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.high: Optional[int] = None
+        self.low: Optional[int] = None
+        self.invalid = 0
+        self.digest = TDigest(compression)
+
+    def update(self, scores: list[int]) -> None:
+        """
+        Fold one chunk of scores into the summary.
+
+        Args:
+            scores: Parsed integer scores
+        """
+        count = len(scores)
+        if not count:
+            return
+        total = sum(scores)
+        mean = total / count
+        deviations = list(map(sub, scores, repeat(mean)))
+        chunk = ScoreSummary()
+        chunk.count, chunk.total, chunk.mean = count, total, mean
+        chunk.m2 = sum(map(mul, deviations, deviations))
+        chunk.high, chunk.low = max(scores), min(scores)
+        self._merge_moments(chunk)
+        self.digest.update(scores)
+
+    def merge(self, other: "ScoreSummary") -> None:
+        """
+        Combine another summary, for example one from another shard.
+
+        Args:
+            other: Summary to merge; it is left unchanged
+        """
+        self._merge_moments(other)
+        self.invalid += other.invalid
+        self.digest.merge(other.digest)
+
+    def _merge_moments(self, other: "ScoreSummary") -> None:
+        """
+        Merge count, total, extremes, mean and M2 with Chan's formula.
+
+        Args:
+            other: Summary whose moments are merged in
+        """
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.total = other.count, other.total
+            self.mean, self.m2 = other.mean, other.m2
+            self.high, self.low = other.high, other.low
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.high = max(self.high, other.high)  # type: ignore
+        self.low = min(self.low, other.low)  # type: ignore
+
+    @property
+    def variance(self) -> float:
+        """Return the population variance of the scores."""
+        return self.m2 / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Estimate a percentile of the scores.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Approximate score at that percentile, or None if empty
+        """
+        return self.digest.percentile(percent)
+
+
+def parse_chunk(tokens: list[str]) -> tuple[list[int], int]:
+    """
+    Parse score tokens, counting invalid ones instead of raising.
+
+    Args:
+        tokens: Whitespace-separated score strings
+
+    Returns:
+        Tuple of (valid scores, number of invalid tokens)
+    """
+    try:
+        return list(map(int, tokens)), 0
+    except ValueError:
+        pass
+    scores: list[int] = []
+    for token in tokens:
+        try:
+            scores.append(int(token))
+        except ValueError:
+            continue
+    return scores, len(tokens) - len(scores)
+
+
+def iter_score_chunks(source: Any) -> Iterator[list[str]]:
+    """
+    Yield chunks of score tokens from a path, file object or iterable.
+
+    Args:
+        source: File path, open text file (such as sys.stdin), or an
+            iterable of scores or score strings
+
+    Yields:
+        Lists of score strings
+    """
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as handle:
+            yield from iter_score_chunks(handle)
+        return
+    if hasattr(source, "readlines"):
+        lines = source.readlines(READ_HINT)
+        while lines:
+            yield "".join(lines).split()
+            lines = source.readlines(READ_HINT)
+        return
+    chunk: list[str] = []
+    for item in source:
+        chunk.append(str(item))
+        if len(chunk) >= READ_HINT // 8:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def summarize_scores(
+    source: Any,
+    compression: int = DEFAULT_COMPRESSION
+) -> ScoreSummary:
+    """
+    Summarize a score stream in one pass with constant memory.
+
+    Args:
+        source: File path, open text file, or iterable of scores
+        compression: t-digest compression for percentile estimates
+
+    Returns:
+        Summary of every valid score in the stream
+    """
+    summary = ScoreSummary(compression)
+    for tokens in iter_score_chunks(source):
+        scores, invalid = parse_chunk(tokens)
+        summary.invalid += invalid
+        summary.update(scores)
+    return summary
+
+
+def summarize_shards(
+    paths: Iterable[str],
+    max_workers: Optional[int] = None
+) -> ScoreSummary:
+    """
+    Summarize score files in parallel and merge the shard summaries.
+
+    Args:
+        paths: Score files, one shard each
+        max_workers: Process pool size (defaults to the CPU count)
+
+    Returns:
+        Merged summary of all shards
+    """
+    merged = ScoreSummary()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for summary in executor.map(summarize_scores, paths):
+            merged.merge(summary)
+    return merged
+
+
+def print_summary(summary: ScoreSummary) -> None:
+    """
+    Print a streaming score summary.
+
+    Args:
+        summary: Summary to report
+    """
+    print("=== Player Score Analytics (stream) ===")
+    if not summary.count:
+        print("No scores provided.")
+        return
+    print(f"Total players: {summary.count}")
+    print(f"Total score: {summary.total}")
+    print(f"Average score: {summary.mean:.1f}")
+    print(f"High score: {summary.high}")
+    print(f"Low score: {summary.low}")
+    print(f"Score range: {summary.high - summary.low}")  # type: ignore
+    print(f"Score variance: {summary.variance:.1f}")
+    for percent in REPORT_PERCENTILES:
+        print(f"P{percent} score (approx): "
+              f"{summary.percentile(percent):.1f}")
+    if summary.invalid:
+        print(f"Invalid entries skipped: {summary.invalid}")
 
 
 def analyze_scores(score_strings: list[str]) -> None:
@@ -26,21 +408,35 @@ def analyze_scores(score_strings: list[str]) -> None:
         print("No scores provided. Usage: python3 ft_score_analytics.py <score1> <score2> ...")
         return
 
+    total = sum(scores)
+    high = max(scores)
+    low = min(scores)
     print("=== Player Score Analytics ===")
     print(f"Scores processed: {scores}")
     print(f"Total players: {len(scores)}")
-    print(f"Total score: {sum(scores)}")
-    print(f"Average score: {sum(scores) / len(scores):.1f}")
-    print(f"High score: {max(scores)}")
-    print(f"Low score: {min(scores)}")
-    print(f"Score range: {max(scores) - min(scores)}")
+    print(f"Total score: {total}")
+    print(f"Average score: {total / len(scores):.1f}")
+    print(f"High score: {high}")
+    print(f"Low score: {low}")
+    print(f"Score range: {high - low}")
 
 
 def main() -> None:
-    """Run score analytics on command-line arguments."""
+    """
+    Run score analytics on command-line arguments.
+
+    With --stream, scores are read from the given files (summarized in
+    parallel) or from stdin, one or more per line.
+    """
     if len(sys.argv) < 2:
         print("=== Player Score Analytics ===")
         print("No scores provided. Usage: python3 ft_score_analytics.py <score1> <score2> ...")
+    elif sys.argv[1] == "--stream":
+        paths = sys.argv[2:]
+        if len(paths) > 1:
+            print_summary(summarize_shards(paths))
+        else:
+            print_summary(summarize_scores(paths[0] if paths else sys.stdin))
     else:
         analyze_scores(sys.argv[1:])
 
@@ -1,8 +1,25 @@
 #!/usr/bin/env python3
 """Position Tracker - 3D coordinate system using tuples."""
 
+import heapq
 import math
 import sys
+from array import array
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from itertools import repeat
+from typing import Any, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+NUMPY_AVAILABLE = np is not None
+DEFAULT_CELL_SIZE = 16.0
+
+Position = tuple[float, float, float]
+Cell = tuple[int, int, int]
+ParseError = tuple[int, str]
 
 
 def parse_coordinates(coord_str: str) -> tuple[int, int, int]:
@@ -35,9 +52,357 @@ def distance_3d(pos1: tuple[int, int, int], pos2: tuple[int, int, int]) -> float
     Returns:
         Distance between the two positions
     """
-    x1, y1, z1 = pos1
-    x2, y2, z2 = pos2
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2)
+    return math.dist(pos1, pos2)
+
+
+def parse_coordinate_block(
+    source: Any,
+    use_numpy: bool = False
+) -> tuple[Any, list[ParseError]]:
+    """
+    Parse many 'x,y,z' rows at once into a flat int32 block.
+
+    When every row has exactly two commas, the rows are joined with
+    commas and split once, so each field stays within its own row, and
+    converted with one array('i', map(int, ...)) call that rejects empty
+    or space-separated fields just as parse_coordinates does. Only if
+    some row is malformed does it fall back to parsing row by row, so
+    bad rows are reported instead of raised and the good rows are kept.
+
+    Args:
+        source: Text or bytes with one 'x,y,z' per line, or an iterable
+            of row strings
+        use_numpy: Return an (N, 3) NumPy view instead of array('i')
+
+    Returns:
+        Tuple of (valid rows in input order, list of (row index, error))
+
+    Raises:
+        RuntimeError: If use_numpy is set but NumPy is not installed
+    """
+    if use_numpy and not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is not installed")
+    if isinstance(source, bytes):
+        source = source.decode("utf-8")
+    lines = source.splitlines() if isinstance(source, str) else list(source)
+    errors: list[ParseError] = []
+    block = None
+    commas = list(map(str.count, lines, repeat(",")))
+    if lines and commas.count(2) == len(lines):
+        try:
+            block = array("i", map(int, ",".join(lines).split(",")))
+        except (ValueError, OverflowError):
+            block = None
+    if block is None:
+        block = array("i")
+        for row, line in enumerate(lines):
+            try:
+                block.extend(array("i", parse_coordinates(line)))
+            except (ValueError, OverflowError) as error:
+                errors.append((row, str(error)))
+    if use_numpy:
+        return np.frombuffer(block, dtype=np.int32).reshape(-1, 3), errors
+    return block, errors
+
+
+def as_positions(block: Any) -> Sequence[Position]:
+    """
+    Return a batch of positions as a sequence of (x, y, z) rows.
+
+    Args:
+        block: Flat array('i') from parse_coordinate_block, or any
+            sequence of positions
+
+    Returns:
+        Sequence of positions
+    """
+    if isinstance(block, array):
+        return list(zip(*[iter(block)] * 3))
+    return block
+
+
+def distances_from(origin: Position, block: Any) -> Any:
+    """
+    Compute the distance from one origin to every position in a batch.
+
+    Args:
+        origin: Reference (x, y, z) position
+        block: Positions, as array('i'), an (N, 3) array or tuples
+
+    Returns:
+        N distances, as a NumPy array or a list of floats
+    """
+    if NUMPY_AVAILABLE:
+        deltas = np.asarray(block, dtype=np.float64).reshape(-1, 3) - \
+            np.asarray(origin, dtype=np.float64)
+        return np.sqrt(np.einsum("ij,ij->i", deltas, deltas))
+    return list(map(math.dist, repeat(origin), as_positions(block)))
+
+
+def distance_matrix(
+    points_a: Sequence[Position],
+    points_b: Optional[Sequence[Position]] = None
+) -> Any:
+    """
+    Compute every distance between two batches of positions.
+
+    Uses NumPy broadcasting when available, otherwise math.dist per pair.
+
+    Args:
+        points_a: N positions, as tuples or a flat array('i') block
+        points_b: M positions (defaults to points_a for all-pairs)
+
+    Returns:
+        N x M distances, as a NumPy array or a list of lists
+    """
+    if points_b is None:
+        points_b = points_a
+    points_a = as_positions(points_a)
+    points_b = as_positions(points_b)
+    if NUMPY_AVAILABLE:
+        block_a = np.asarray(points_a, dtype=np.float64).reshape(-1, 3)
+        block_b = np.asarray(points_b, dtype=np.float64).reshape(-1, 3)
+        deltas = block_a[:, np.newaxis, :] - block_b[np.newaxis, :, :]
+        return np.sqrt(np.einsum("ijk,ijk->ij", deltas, deltas))
+    return [[math.dist(a, b) for b in points_b] for a in points_a]
+
+
+class SpatialGrid:
+    """
+    Uniform hash grid over 3D positions for neighbour queries.
+
+    Each key lives in the cubic cell containing its position, so insert,
+    move and remove are O(1) and a query only visits cells that overlap
+    its search region. Only occupied cells are stored.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        """
+        Create an empty grid.
+
+        Args:
+            cell_size: Edge length of a cell; about the typical query radius
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+        self.cells: dict[Cell, dict[Hashable, Position]] = {}
+        self.positions: dict[Hashable, Position] = {}
+
+    @classmethod
+    def build(
+        cls,
+        positions: Iterable[tuple[Hashable, Position]],
+        cell_size: float = DEFAULT_CELL_SIZE
+    ) -> "SpatialGrid":
+        """
+        Bulk-build a grid from (key, position) pairs.
+
+        Args:
+            positions: Keys and their (x, y, z) positions
+            cell_size: Edge length of a cell
+
+        Returns:
+            Grid holding every position
+        """
+        grid = cls(cell_size)
+        cells = grid.cells
+        cell_of = grid.cell_of
+        for key, position in positions:
+            if key in grid.positions:
+                grid.remove(key)
+            grid.positions[key] = position
+            cells.setdefault(cell_of(position), {})[key] = position
+        return grid
+
+    def __len__(self) -> int:
+        """Return the number of indexed keys."""
+        return len(self.positions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True if key is indexed."""
+        return key in self.positions
+
+    def cell_of(self, position: Position) -> Cell:
+        """
+        Return the cell containing a position.
+
+        Args:
+            position: (x, y, z) position
+
+        Returns:
+            Integer cell coordinates
+        """
+        size = self.cell_size
+        x, y, z = position
+        return int(x // size), int(y // size), int(z // size)
+
+    def insert(self, key: Hashable, position: Position) -> None:
+        """
+        Add a key, or move it if it is already indexed.
+
+        Args:
+            key: Identifier such as a player id
+            position: (x, y, z) position
+        """
+        if key in self.positions:
+            self.move(key, position)
+            return
+        self.positions[key] = position
+        self.cells.setdefault(self.cell_of(position), {})[key] = position
+
+    def move(self, key: Hashable, position: Position) -> None:
+        """
+        Update a key's position, changing cell only when needed.
+
+        Args:
+            key: Indexed identifier
+            position: New (x, y, z) position
+
+        Raises:
+            KeyError: If key is not indexed
+        """
+        old_cell = self.cell_of(self.positions[key])
+        new_cell = self.cell_of(position)
+        self.positions[key] = position
+        if old_cell == new_cell:
+            self.cells[old_cell][key] = position
+            return
+        self._discard(old_cell, key)
+        self.cells.setdefault(new_cell, {})[key] = position
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove a key from the grid.
+
+        Args:
+            key: Indexed identifier
+
+        Raises:
+            KeyError: If key is not indexed
+        """
+        self._discard(self.cell_of(self.positions.pop(key)), key)
+
+    def _discard(self, cell: Cell, key: Hashable) -> None:
+        """
+        Drop a key from a cell, dropping the cell once it is empty.
+
+        Args:
+            cell: Cell holding the key
+            key: Identifier to drop
+        """
+        members = self.cells[cell]
+        del members[key]
+        if not members:
+            del self.cells[cell]
+
+    def within_radius(
+        self,
+        center: Position,
+        radius: float
+    ) -> list[tuple[Hashable, float]]:
+        """
+        Find every key within radius of center.
+
+        Args:
+            center: Query (x, y, z) position
+            radius: Search radius
+
+        Returns:
+            (key, distance) pairs sorted by distance
+        """
+        low = self.cell_of(tuple(c - radius for c in center))  # type: ignore
+        high = self.cell_of(tuple(c + radius for c in center))  # type: ignore
+        spans = [range(lo, hi + 1) for lo, hi in zip(low, high)]
+        candidates: Iterable[dict[Hashable, Position]]
+        if math.prod(map(len, spans)) > len(self.cells):
+            candidates = self.cells.values()
+        else:
+            cells = self.cells
+            candidates = [
+                cells[(x, y, z)] for x in spans[0] for y in spans[1]
+                for z in spans[2] if (x, y, z) in cells
+            ]
+        dist = math.dist
+        found = []
+        for members in candidates:
+            for key, position in members.items():
+                distance = dist(center, position)
+                if distance <= radius:
+                    found.append((key, distance))
+        found.sort(key=lambda item: item[1])
+        return found
+
+    def _ring(self, cell: Cell, ring: int) -> Iterator[Cell]:
+        """
+        Yield the occupied cells at Chebyshev distance ring from cell.
+
+        Args:
+            cell: Center cell
+            ring: Ring index (0 is the cell itself)
+
+        Yields:
+            Occupied cell coordinates
+        """
+        cx, cy, cz = cell
+        cells = self.cells
+        full = range(-ring, ring + 1)
+        for dx in full:
+            for dy in full:
+                if abs(dx) == ring or abs(dy) == ring:
+                    offsets: Iterable[int] = full
+                else:
+                    offsets = (-ring, ring) if ring else (0,)
+                for dz in offsets:
+                    neighbour = (cx + dx, cy + dy, cz + dz)
+                    if neighbour in cells:
+                        yield neighbour
+
+    def nearest(
+        self,
+        center: Position,
+        k: int = 1
+    ) -> list[tuple[Hashable, float]]:
+        """
+        Find the k keys closest to center.
+
+        Rings of cells are searched outwards until the k-th best distance
+        is no larger than the distance to any unvisited ring; once a ring
+        would hold more cells than are occupied, the rest is brute-forced.
+
+        Args:
+            center: Query (x, y, z) position
+            k: Number of neighbours
+
+        Returns:
+            Up to k (key, distance) pairs sorted by distance
+        """
+        if k < 1 or not self.positions:
+            return []
+        dist = math.dist
+        best: list[tuple[float, int, Hashable]] = []
+        origin = self.cell_of(center)
+        visited = 0
+        ring = 0
+        while visited < len(self.cells):
+            if (2 * ring + 1) ** 3 > 8 * len(self.cells):
+                return [(key, distance) for key, distance in heapq.nsmallest(
+                    k, ((key, dist(center, position))
+                        for key, position in self.positions.items()),
+                    key=lambda item: item[1])]
+            for cell in self._ring(origin, ring):
+                visited += 1
+                for key, position in self.cells[cell].items():
+                    entry = (-dist(center, position), id(key), key)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry[0] > best[0][0]:
+                        heapq.heapreplace(best, entry)
+            if len(best) == k and -best[0][0] <= ring * self.cell_size:
+                break
+            ring += 1
+        return [(key, -negated) for negated, _, key in sorted(best,
+                                                              reverse=True)]
 
 
 def main() -> None:
@@ -1,6 +1,242 @@
 #!/usr/bin/env python3
 """Achievement Hunter - Track achievements using sets."""
 
+from collections.abc import Iterable
+from functools import reduce
+from operator import and_, or_
+from typing import Optional
+
+
+class AchievementRegistry:
+    """
+    Bitset-backed achievement store for many players.
+
+    Achievement names are interned to bit positions and each player is a
+    single int bitmask, so set algebra across players becomes bulk
+    bitwise operations on machine-word-packed ints.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self.names: list[str] = []
+        self.bits: dict[str, int] = {}
+        self.players: dict[str, int] = {}
+
+    def intern(self, name: str) -> int:
+        """
+        Return the bit position of an achievement, assigning a new one.
+
+        Args:
+            name: Achievement name
+
+        Returns:
+            Bit position of the achievement
+        """
+        bit = self.bits.get(name)
+        if bit is None:
+            bit = self.bits[name] = len(self.names)
+            self.names.append(name)
+        return bit
+
+    def mask_of(self, names: Iterable[str]) -> int:
+        """
+        Encode achievement names as a bitmask.
+
+        Args:
+            names: Achievement names
+
+        Returns:
+            Bitmask with one bit per achievement
+        """
+        intern = self.intern
+        mask = 0
+        for name in names:
+            mask |= 1 << intern(name)
+        return mask
+
+    def names_of(self, mask: int) -> set[str]:
+        """
+        Decode a bitmask into achievement names.
+
+        Args:
+            mask: Bitmask of achievements
+
+        Returns:
+            Set of achievement names
+        """
+        names = self.names
+        found: set[str] = set()
+        while mask:
+            lowest = mask & -mask
+            found.add(names[lowest.bit_length() - 1])
+            mask ^= lowest
+        return found
+
+    def award(self, player: str, *names: str) -> None:
+        """
+        Grant achievements to a player.
+
+        Args:
+            player: Player name
+            names: Achievements to grant
+        """
+        self.players[player] = self.players.get(player, 0) | \
+            self.mask_of(names)
+
+    def revoke(self, player: str, *names: str) -> None:
+        """
+        Remove achievements from a player.
+
+        Args:
+            player: Player name
+            names: Achievements to remove
+        """
+        mask = 0
+        for name in names:
+            bit = self.bits.get(name)
+            if bit is not None:
+                mask |= 1 << bit
+        self.players[player] = self.players.get(player, 0) & ~mask
+
+    def achievements(self, player: str) -> set[str]:
+        """
+        Return a player's achievements.
+
+        Args:
+            player: Player name
+
+        Returns:
+            Set of achievement names
+        """
+        return self.names_of(self.players.get(player, 0))
+
+    def _masks(self, players: Optional[Iterable[str]]) -> list[int]:
+        """
+        Return the masks of the given players, or of every player.
+
+        Args:
+            players: Player names, or None for all players
+
+        Returns:
+            List of player bitmasks
+        """
+        if players is None:
+            return list(self.players.values())
+        get = self.players.get
+        return [get(player, 0) for player in players]
+
+    def union(self, players: Optional[Iterable[str]] = None) -> set[str]:
+        """
+        Return achievements held by at least one of the players.
+
+        Args:
+            players: Player names, or None for all players
+
+        Returns:
+            Set of achievement names
+        """
+        return self.names_of(reduce(or_, self._masks(players), 0))
+
+    def intersection(
+        self,
+        players: Optional[Iterable[str]] = None
+    ) -> set[str]:
+        """
+        Return achievements held by every one of the players.
+
+        Args:
+            players: Player names, or None for all players
+
+        Returns:
+            Set of achievement names (empty if there are no players)
+        """
+        masks = self._masks(players)
+        return self.names_of(reduce(and_, masks) if masks else 0)
+
+    def unique(
+        self,
+        player: str,
+        others: Optional[Iterable[str]] = None
+    ) -> set[str]:
+        """
+        Return a player's achievements that none of the others hold.
+
+        Args:
+            player: Player name
+            others: Players to compare with, or None for everyone else
+
+        Returns:
+            Set of achievement names
+        """
+        if others is None:
+            others = (name for name in self.players if name != player)
+        rest = reduce(or_, self._masks(others), 0)
+        return self.names_of(self.players.get(player, 0) & ~rest)
+
+    def rare(self, players: Optional[Iterable[str]] = None) -> set[str]:
+        """
+        Return achievements held by exactly one of the players.
+
+        Tracks "seen once" and "seen again" masks, so the cost is a few
+        bitwise operations per player instead of one membership test per
+        player and achievement.
+
+        Args:
+            players: Player names, or None for all players
+
+        Returns:
+            Set of achievement names
+        """
+        once = more = 0
+        for mask in self._masks(players):
+            more |= once & mask
+            once |= mask
+        return self.names_of(once & ~more)
+
+    def counts(
+        self,
+        players: Optional[Iterable[str]] = None
+    ) -> dict[str, int]:
+        """
+        Count how many players hold each achievement.
+
+        Player masks are summed into bit-sliced counters (plane i holds
+        bit i of every achievement's count) with ripple-carry adds, so
+        each player costs about log2(players) bitwise operations.
+
+        Args:
+            players: Player names, or None for all players
+
+        Returns:
+            Mapping of achievement name to holder count
+        """
+        planes: list[int] = []
+        for carry in self._masks(players):
+            for level, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[level] = plane ^ carry
+                carry &= plane
+            if carry:
+                planes.append(carry)
+        return {
+            name: sum(((plane >> bit) & 1) << level
+                      for level, plane in enumerate(planes))
+            for bit, name in enumerate(self.names)
+        }
+
+    def popcount(self, player: str) -> int:
+        """
+        Return how many achievements a player holds.
+
+        Args:
+            player: Player name
+
+        Returns:
+            Number of achievements
+        """
+        return self.players.get(player, 0).bit_count()
+
 
 def main() -> None:
     """Demonstrate achievement tracking with sets."""
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# **************************************************************************** #
+#                                                                              #
+#                                                         :::      ::::::::    #
+#    benchmark.py                                       :+:      :+:    :+:    #
+#                                                     +:+ +:+         +:+      #
+#    By: danicort <danicort@student.42.fr>          +#+  +:+       +#+         #
+#                                                 +#+#+#+#+#+   +#+            #
+#    Created: 2026/10/18 00:00:00 by danicort          #+#    #+#              #
+#    Updated: 2026/10/18 00:00:00 by danicort         ###   ########.fr        #
+#                                                                              #
+# **************************************************************************** #
+
+"""Nexus Benchmarks - Reproducible throughput and memory runs for module-05.
+
+Each (workload, size) case runs in a fresh worker process so that peak
+RSS is attributable to that case alone. File-based payloads are written
+to disk row by row, and the RSS high-water mark after setup is reported
+next to the final one, so the run's own growth can be read off. Results
+are printed as JSON so two runs can be diffed.
+
+Usage: python3 benchmark.py [--sizes 1000 100000] [--workloads json csv]
+                            [--trace-allocations] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import (IO, Any, Callable, Dict, List, Optional, Tuple,
+                    TypeVar)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+for exercise in ("ex0", "ex1", "ex2"):
+    sys.path.insert(0, os.path.join(BASE_DIR, exercise))
+
+from data_stream import SensorStream, TransactionStream  # noqa: E402
+from nexus_pipeline import (  # noqa: E402
+    CSVAdapter, InputStage, JSONAdapter, OutputStage, ProcessingPipeline,
+    ProcessingStage, TransformStage
+)
+from stream_processor import LogProcessor  # noqa: E402
+
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+DEFAULT_SEED = 42
+LOG_LEVELS = ["INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL"]
+
+Case = Tuple[Callable[[], Any], Optional[str], List[ProcessingStage]]
+Workload = Callable[[int, random.Random], Case]
+P = TypeVar("P", bound=ProcessingPipeline)
+
+
+def write_json(handle: IO[str], size: int, rng: random.Random) -> None:
+    """Write NDJSON sensor documents one line at a time."""
+    for i in range(size):
+        handle.write(json.dumps({"sensor": "temp", "id": i,
+                                 "value": round(rng.uniform(-10, 45), 1),
+                                 "unit": "C"}) + "\n")
+
+
+def write_csv(handle: IO[str], size: int, rng: random.Random) -> None:
+    """Write CSV user activity rows with a header, one row at a time."""
+    actions = ["login", "logout", "buy", "sell", "view"]
+    handle.write("user,action,timestamp\n")
+    for i in range(size):
+        handle.write(f"user_{rng.randrange(10000)},{rng.choice(actions)},"
+                     f"{1700000000 + i}\n")
+
+
+def write_temp(
+    writer: Callable[[IO[str], int, random.Random], None],
+    suffix: str,
+    size: int,
+    rng: random.Random
+) -> str:
+    """Write a generated payload to a temporary file and return its path."""
+    handle = tempfile.NamedTemporaryFile("w", suffix=suffix, delete=False)
+    with handle:
+        writer(handle, size, rng)
+    return handle.name
+
+
+def generate_sensor(size: int, rng: random.Random) -> List[str]:
+    """Generate kind:value sensor readings."""
+    kinds = ["temp", "humidity", "pressure"]
+    return [f"{rng.choice(kinds)}:{rng.uniform(0, 40):.1f}"
+            for _ in range(size)]
+
+
+def generate_transactions(size: int, rng: random.Random) -> List[str]:
+    """Generate buy/sell transactions."""
+    return [f"{rng.choice(('buy', 'sell'))}:{rng.randrange(1, 500)}"
+            for _ in range(size)]
+
+
+def generate_logs(size: int, rng: random.Random) -> List[str]:
+    """Generate log lines with a random severity level."""
+    return [f"{rng.choice(LOG_LEVELS)}: event {i} handled"
+            for i in range(size)]
+
+
+def build_pipeline(pipeline: P) -> P:
+    """Attach the standard three stages to a pipeline."""
+    pipeline.add_stage(InputStage())
+    pipeline.add_stage(TransformStage())
+    pipeline.add_stage(OutputStage())
+    return pipeline
+
+
+def workload_json(size: int, rng: random.Random) -> Case:
+    """Prepare a streaming JSONAdapter run over an NDJSON file."""
+    path = write_temp(write_json, ".json", size, rng)
+    adapter = build_pipeline(JSONAdapter("bench_json"))
+
+    def run() -> Any:
+        """Stream the NDJSON file through the adapter."""
+        with open(path, "rb") as source:
+            for _ in adapter.process_stream(source):
+                pass
+        return adapter.get_stats()
+    return run, path, adapter.stages
+
+
+def workload_csv(size: int, rng: random.Random) -> Case:
+    """Prepare a memory-mapped CSVAdapter run."""
+    path = write_temp(write_csv, ".csv", size, rng)
+    adapter = build_pipeline(CSVAdapter("bench_csv"))
+
+    def run() -> Any:
+        """Process the CSV file through the adapter."""
+        for _ in adapter.process_file(path):
+            pass
+        return adapter.get_stats()
+    return run, path, adapter.stages
+
+
+def workload_sensor(size: int, rng: random.Random) -> Case:
+    """Prepare a SensorStream batch run."""
+    batch = generate_sensor(size, rng)
+    stream = SensorStream("BENCH_SENSOR")
+
+    def run() -> Any:
+        """Aggregate and filter the sensor batch."""
+        parsed = stream.parse_batch(batch)
+        stream.process_batch(batch, parsed)
+        stream.filter_data(batch, "critical", parsed)
+        return stream.get_stats()
+    return run, None, []
+
+
+def workload_transaction(size: int, rng: random.Random) -> Case:
+    """Prepare a TransactionStream batch run."""
+    batch = generate_transactions(size, rng)
+    stream = TransactionStream("BENCH_TRANS")
+
+    def run() -> Any:
+        """Aggregate and filter the transaction batch."""
+        parsed = stream.parse_batch(batch)
+        stream.process_batch(batch, parsed)
+        stream.filter_data(batch, "large", parsed)
+        return stream.get_stats()
+    return run, None, []
+
+
+def workload_log(size: int, rng: random.Random) -> Case:
+    """Prepare a LogProcessor run over individual lines."""
+    lines = generate_logs(size, rng)
+    processor = LogProcessor()
+
+    def run() -> Any:
+        """Process every log line."""
+        process = processor.process
+        for line in lines:
+            process(line)
+        return None
+    return run, None, []
+
+
+WORKLOADS: Dict[str, Workload] = {
+    "json": workload_json,
+    "csv": workload_csv,
+    "sensor": workload_sensor,
+    "transaction": workload_transaction,
+    "log": workload_log
+}
+
+
+class StageAllocations:
+    """Per-stage memory counters gathered under tracemalloc.
+
+    CPython does not count allocation events, so each call records the
+    number of new memory blocks the stage left alive (its net block
+    count) and the traced bytes it needed above its entry level.
+    """
+
+    def __init__(self, stage: ProcessingStage) -> None:
+        """Wrap a stage's process and process_batch methods in place."""
+        self.name = type(stage).__name__
+        self.calls = 0
+        self.records = 0
+        self.net_blocks = 0
+        self.peak_bytes = 0
+        self.overall_peak = 0
+        self.active = False
+        process = stage.process
+        setattr(stage, "process",
+                lambda data: self.measure(process, data, 1))
+        process_batch = getattr(stage, "process_batch", None)
+        if process_batch is not None:
+            setattr(stage, "process_batch",
+                    lambda records: self.measure(process_batch, records,
+                                                 len(records)))
+
+    def measure(
+        self,
+        method: Callable[[Any], Any],
+        data: Any,
+        records: int
+    ) -> Any:
+        """Call one stage method and fold its memory use in.
+
+        Calls made from inside a measured call (process_batch falling
+        back to process) are already covered and pass straight through.
+        """
+        if self.active:
+            return method(data)
+        current, peak = tracemalloc.get_traced_memory()
+        self.overall_peak = max(self.overall_peak, peak)
+        blocks = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+        self.active = True
+        try:
+            result = method(data)
+        finally:
+            self.active = False
+        _, peak = tracemalloc.get_traced_memory()
+        self.net_blocks += sys.getallocatedblocks() - blocks
+        self.peak_bytes = max(self.peak_bytes, peak - current)
+        self.overall_peak = max(self.overall_peak, peak)
+        self.calls += 1
+        self.records += records
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the counters as a JSON-friendly dict."""
+        return {
+            "stage": self.name,
+            "calls": self.calls,
+            "records": self.records,
+            "net_blocks": self.net_blocks,
+            "peak_bytes": self.peak_bytes
+        }
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Return this process's peak resident set size, if available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_case(
+    workload: str,
+    size: int,
+    seed: int,
+    trace_allocations: bool
+) -> Dict[str, Any]:
+    """Run one benchmark case and return its measurements.
+
+    peak_rss_growth_bytes is how far the run pushed the RSS high-water
+    mark above where setup left it; in-memory batches still count
+    towards setup_peak_rss_bytes, file payloads do not.
+    """
+    run, temp_path, _ = WORKLOADS[workload](size, random.Random(seed))
+    try:
+        setup_peak = peak_rss_bytes()
+        started = perf_counter()
+        stats = run()
+        elapsed = perf_counter() - started
+        peak = peak_rss_bytes()
+        result: Dict[str, Any] = {
+            "workload": workload,
+            "size": size,
+            "seconds": elapsed,
+            "records_per_second": size / elapsed if elapsed > 0 else 0.0,
+            "peak_rss_bytes": peak,
+            "setup_peak_rss_bytes": setup_peak,
+            "peak_rss_growth_bytes": (
+                peak - setup_peak
+                if peak is not None and setup_peak is not None else None
+            )
+        }
+        if isinstance(stats, dict) and "stages" in stats:
+            result["stages"] = stats["stages"]
+        if trace_allocations:
+            result.update(trace_case(workload, size, seed))
+        return result
+    finally:
+        if temp_path is not None:
+            os.remove(temp_path)
+
+
+def trace_case(workload: str, size: int, seed: int) -> Dict[str, Any]:
+    """Re-run a case under tracemalloc and report its memory blocks.
+
+    retained_blocks and retained_bytes count the blocks allocated during
+    the run that are still alive once it returns (results, stats,
+    caches), not every allocation made along the way. Pipeline stages
+    additionally get per-stage counters from StageAllocations.
+    """
+    run, temp_path, stages = WORKLOADS[workload](size, random.Random(seed))
+    counters = [StageAllocations(stage) for stage in stages]
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        run()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        if temp_path is not None:
+            os.remove(temp_path)
+    retained = snapshot.statistics("filename")
+    result: Dict[str, Any] = {
+        "traced_peak_bytes": max([peak] + [counter.overall_peak
+                                           for counter in counters]),
+        "retained_blocks": sum(stat.count for stat in retained),
+        "retained_bytes": sum(stat.size for stat in retained),
+        "allocated_blocks_delta": sys.getallocatedblocks() - blocks_before
+    }
+    if counters:
+        result["stage_allocations"] = [
+            counter.snapshot() for counter in counters
+        ]
+    return result
+
+
+def run_benchmarks(
+    workloads: List[str],
+    sizes: List[int],
+    seed: int = DEFAULT_SEED,
+    trace_allocations: bool = False
+) -> Dict[str, Any]:
+    """Run every workload at every size, one fresh process per case."""
+    cases: List[Dict[str, Any]] = []
+    for workload in workloads:
+        for size in sizes:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(run_case, workload, size, seed,
+                                         trace_allocations)
+                cases.append(future.result())
+    return {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "seed": seed,
+        "cases": cases
+    }
+
+
+def main() -> None:
+    """Parse arguments and emit benchmark results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=DEFAULT_SIZES)
+    parser.add_argument("--workloads", nargs="+", choices=sorted(WORKLOADS),
+                        default=list(WORKLOADS))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--trace-allocations", action="store_true")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+    report = run_benchmarks(args.workloads, args.sizes, args.seed,
+                            args.trace_allocations)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
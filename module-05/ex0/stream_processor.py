@@ -13,13 +13,42 @@
 
 """Data Processor Foundation - Abstract polymorphic data processing system."""
 
+import math
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import Any, List
+from itertools import islice, repeat
+from operator import mul, sub
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type,
+    Union, cast
+)
+
+DEFAULT_LOG_LEVELS = ("CRITICAL", "ERROR", "WARNING", "DEBUG", "INFO")
+DEFAULT_ALERT_LEVELS = ("CRITICAL", "ERROR")
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_CHUNK_VALUES = 1 << 16
+NUMERIC_TYPES = (int, float)
+
+# Byte classes for text counting: ASCII whitespace, UTF-8 continuation
+# bytes, and everything else. A word starts at every " x" transition.
+BYTE_CLASSES = bytes(
+    ord(" ") if byte in b" \t\n\r\x0b\x0c"
+    else ord("c") if 0x80 <= byte < 0xC0
+    else ord("x")
+    for byte in range(256)
+)
+
+Number = Union[int, float]
+PathSource = Union[str, bytes, "os.PathLike[str]"]
+StreamSource = Union[PathSource, Iterable[Any]]
 
 
 class DataProcessor(ABC):
     """Abstract base class for polymorphic data processing."""
 
+    record_types: Tuple[type, ...] = (object,)
+
     @abstractmethod
     def process(self, data: Any) -> str:
         """Process the data and return result string."""
@@ -34,30 +63,254 @@ class DataProcessor(ABC):
         """Format the output string."""
         return f"Output: {result}"
 
+    def process_batch(self, records: List[Any]) -> List[str]:
+        """Process a batch of records already routed to this processor."""
+        process = self.process
+        return [process(record) for record in records]
+
+
+def is_path(source: Any) -> bool:
+    """Return True if a stream source names a file rather than data."""
+    return isinstance(source, (str, bytes, os.PathLike))
+
+
+def iter_byte_chunks(
+    source: StreamSource,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield byte chunks from a file path or an iterable of chunks.
+
+    Files are read with readinto into one reused buffer, so memory stays
+    at chunk_size however large the file is; full chunks are that buffer
+    itself, typed as bytes. Callers must finish with a chunk before
+    asking for the next. String chunks are UTF-8 encoded.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    if not is_path(source):
+        for chunk in cast(Iterable[Any], source):
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        return
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(cast(PathSource, source), "rb") as handle:
+        read = handle.readinto(view)
+        while read:
+            if read == chunk_size:
+                yield cast(bytes, buffer)
+            else:
+                yield view[:read].tobytes()
+            read = handle.readinto(view)
+
+
+def parse_numbers(tokens: List[bytes]) -> List[Number]:
+    """Parse whitespace-separated tokens, keeping ints exact when possible."""
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        pass
+    try:
+        return list(map(float, tokens))
+    except ValueError:
+        raise ValueError("Invalid numeric data provided") from None
+
+
+def iter_number_chunks(
+    source: StreamSource,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[List[Number]]:
+    """Yield lists of numbers from a text file path or a number iterable.
+
+    Tokens split across chunk boundaries are carried into the next chunk,
+    so only one chunk of text and its values are held at a time.
+    """
+    if not is_path(source):
+        iterator = iter(cast(Iterable[Any], source))
+        values = list(islice(iterator, DEFAULT_CHUNK_VALUES))
+        while values:
+            yield values
+            values = list(islice(iterator, DEFAULT_CHUNK_VALUES))
+        return
+    carry = b""
+    for chunk in iter_byte_chunks(source, chunk_size):
+        tokens = chunk.split()
+        if carry:
+            if tokens and not chunk[:1].isspace():
+                tokens[0] = carry + tokens[0]
+            else:
+                tokens.insert(0, carry)
+        carry = tokens.pop() if tokens and not chunk[-1:].isspace() else b""
+        if tokens:
+            yield parse_numbers(tokens)
+    if carry:
+        yield parse_numbers([carry])
+
+
+class TextSummary:
+    """Running byte, character, word and line counts for a text stream.
+
+    Counting works on raw UTF-8 bytes: characters are non-continuation
+    bytes and words are runs of non-whitespace, with ASCII whitespace as
+    the separator (as in wc).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counts."""
+        self.bytes = 0
+        self.characters = 0
+        self.words = 0
+        self.newlines = 0
+        self.in_space = True
+        self.ends_with_newline = True
+
+    def update(self, chunk: bytes) -> None:
+        """Fold one chunk of UTF-8 bytes into the counts."""
+        if not chunk:
+            return
+        classes = chunk.translate(BYTE_CLASSES)
+        self.bytes += len(chunk)
+        self.characters += len(chunk) - classes.count(b"c")
+        self.words += classes.count(b" x")
+        if self.in_space and classes[:1] == b"x":
+            self.words += 1
+        self.newlines += chunk.count(b"\n")
+        self.in_space = classes[-1:] == b" "
+        self.ends_with_newline = chunk[-1:] == b"\n"
+
+    @property
+    def lines(self) -> int:
+        """Return the line count, including an unterminated last line."""
+        return self.newlines + (0 if self.ends_with_newline else 1)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counts as a plain dictionary."""
+        return {
+            "bytes": self.bytes,
+            "characters": self.characters,
+            "words": self.words,
+            "lines": self.lines
+        }
+
+
+class NumericSummary:
+    """Mergeable count, sum, min, max and variance over numeric chunks.
+
+    Each chunk's moments are computed with C-level builtins and folded in
+    with Chan's parallel update, so the running state stays constant-size.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty summary."""
+        self.count = 0
+        self.total: Number = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum: Optional[Number] = None
+        self.maximum: Optional[Number] = None
+
+    def update(self, values: Sequence[Any]) -> None:
+        """Validate one chunk of values and fold it into the summary."""
+        if not all(map(isinstance, values, repeat(NUMERIC_TYPES))):
+            raise ValueError("Invalid numeric data provided")
+        count = len(values)
+        if not count:
+            return
+        total = sum(values)
+        mean = total / count
+        deviations = list(map(sub, values, repeat(mean)))
+        chunk = NumericSummary()
+        chunk.count, chunk.total, chunk.mean = count, total, mean
+        chunk.m2 = sum(map(mul, deviations, deviations))
+        chunk.minimum, chunk.maximum = min(values), max(values)
+        self.merge(chunk)
+
+    def merge(self, other: "NumericSummary") -> None:
+        """Combine another summary into this one."""
+        if not other.count:
+            return
+        if not self.count:
+            self.__dict__.update(other.__dict__)
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(cast(Number, self.minimum),
+                           cast(Number, other.minimum))
+        self.maximum = max(cast(Number, self.maximum),
+                           cast(Number, other.maximum))
+
+    @property
+    def average(self) -> float:
+        """Return total / count, or 0 for an empty summary."""
+        return self.total / self.count if self.count else 0
+
+    @property
+    def stddev(self) -> float:
+        """Return the population standard deviation."""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the summary as a plain dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "avg": self.average,
+            "min": self.minimum,
+            "max": self.maximum,
+            "stddev": self.stddev
+        }
+
 
 class NumericProcessor(DataProcessor):
     """Specialized processor for numeric data."""
 
+    record_types = (int, float, list, tuple)
+
     def validate(self, data: Any) -> bool:
         """Validate if data is numeric."""
-        try:
-            if isinstance(data, (list, tuple)):
-                return all(isinstance(x, (int, float)) for x in data)
-            return isinstance(data, (int, float))
-        except (TypeError, ValueError):
-            return False
+        if isinstance(data, (list, tuple)):
+            return all(map(isinstance, data, repeat(NUMERIC_TYPES)))
+        return isinstance(data, NUMERIC_TYPES)
 
     def process(self, data: Any) -> str:
         """Process numeric data with aggregation."""
-        if not self.validate(data):
-            raise ValueError("Invalid numeric data provided")
         if isinstance(data, (list, tuple)):
+            if not all(map(isinstance, data, repeat(NUMERIC_TYPES))):
+                raise ValueError("Invalid numeric data provided")
             count = len(data)
             total = sum(data)
             avg = total / count if count > 0 else 0
             return f"Processed {count} numeric values, sum={total}, avg={avg}"
+        if not isinstance(data, NUMERIC_TYPES):
+            raise ValueError("Invalid numeric data provided")
         return f"Processed single value: {data}"
 
+    def summarize_stream(
+        self,
+        source: StreamSource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> NumericSummary:
+        """Summarize a number file or number iterable in one pass."""
+        summary = NumericSummary()
+        for values in iter_number_chunks(source, chunk_size):
+            summary.update(values)
+        return summary
+
+    def process_stream(
+        self,
+        source: StreamSource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> str:
+        """Process a numeric stream with aggregation."""
+        summary = self.summarize_stream(source, chunk_size)
+        return (f"Processed {summary.count} numeric values, "
+                f"sum={summary.total}, avg={summary.average}, "
+                f"min={summary.minimum}, max={summary.maximum}, "
+                f"stddev={summary.stddev}")
+
     def format_output(self, result: str) -> str:
         """Format numeric output."""
         return result
@@ -66,6 +319,8 @@ class NumericProcessor(DataProcessor):
 class TextProcessor(DataProcessor):
     """Specialized processor for text data."""
 
+    record_types = (str,)
+
     def validate(self, data: Any) -> bool:
         """Validate if data is text."""
         return isinstance(data, str)
@@ -78,40 +333,228 @@ class TextProcessor(DataProcessor):
         word_count = len(data.split())
         return f"Processed text: {char_count} characters, {word_count} words"
 
+    def summarize_stream(
+        self,
+        source: StreamSource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> TextSummary:
+        """Count a text file path or an iterable of str/bytes chunks."""
+        summary = TextSummary()
+        for chunk in iter_byte_chunks(source, chunk_size):
+            summary.update(chunk)
+        return summary
+
+    def process_stream(
+        self,
+        source: StreamSource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> str:
+        """Process a text stream with analysis."""
+        summary = self.summarize_stream(source, chunk_size)
+        return (f"Processed text: {summary.characters} characters, "
+                f"{summary.words} words, {summary.lines} lines")
+
     def format_output(self, result: str) -> str:
         """Format text output."""
         return result
 
 
+class LevelMatcher:
+    """Precompiled log level vocabulary ordered by severity.
+
+    Presence checks use one compiled regex alternation, so a line is
+    scanned once. Finding the most severe level tries levels from most to
+    least severe and stops at the first hit, which in CPython beats
+    collecting every regex match on typical short lines.
+    """
+
+    def __init__(self, levels: Sequence[str]) -> None:
+        """Compile levels, given from most to least severe."""
+        if not levels:
+            raise ValueError("At least one log level is required")
+        self.levels = tuple(levels)
+        alternatives = sorted(self.levels, key=len, reverse=True)
+        self.pattern = re.compile(
+            "|".join(re.escape(level) for level in alternatives)
+        )
+
+    def contains_level(self, text: str) -> bool:
+        """Return True if any level occurs in the text."""
+        return self.pattern.search(text) is not None
+
+    def most_severe(self, text: str) -> Optional[str]:
+        """Return the most severe level occurring in the text, if any."""
+        for level in self.levels:
+            if level in text:
+                return level
+        return None
+
+    def count_levels(self, lines: Iterable[str]) -> Dict[str, int]:
+        """Count lines by most severe level, skipping lines without one."""
+        levels = self.levels
+        counts = dict.fromkeys(levels, 0)
+        for line in lines:
+            for level in levels:
+                if level in line:
+                    counts[level] += 1
+                    break
+        return counts
+
+
 class LogProcessor(DataProcessor):
     """Specialized processor for log entries."""
 
+    record_types = (str,)
+
+    def __init__(
+        self,
+        levels: Sequence[str] = DEFAULT_LOG_LEVELS,
+        alert_levels: Sequence[str] = DEFAULT_ALERT_LEVELS
+    ) -> None:
+        """Initialize with a level vocabulary ordered by severity."""
+        self.matcher = LevelMatcher(levels)
+        self.alert_levels = frozenset(alert_levels)
+
     def validate(self, data: Any) -> bool:
         """Validate if data is a log entry."""
         if not isinstance(data, str):
             return False
-        valid_levels = ["INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL"]
-        return any(level in data for level in valid_levels)
+        return self.matcher.contains_level(data)
 
     def process(self, data: Any) -> str:
         """Process log entry with level detection."""
-        if not self.validate(data):
+        level = self.matcher.most_severe(data) \
+            if isinstance(data, str) else None
+        if level is None:
             raise ValueError("Invalid log entry format")
-        levels = ["CRITICAL", "ERROR", "WARNING", "DEBUG", "INFO"]
-        level = "INFO"
-        for lv in levels:
-            if lv in data:
-                level = lv
-                break
-        alert_level = "ALERT" if level in ["CRITICAL", "ERROR"] else "INFO"
+        alert_level = "ALERT" if level in self.alert_levels else "INFO"
         message = data.split(": ", 1)[1] if ": " in data else data
         return f"[{alert_level}] {level} level detected: {message}"
 
+    def count_levels(self, lines: Iterable[str]) -> Dict[str, int]:
+        """Return per-level line counts for a block of log lines."""
+        return self.matcher.count_levels(lines)
+
     def format_output(self, result: str) -> str:
         """Format log output."""
         return result
 
 
+class ProcessorRouter:
+    """Routes heterogeneous records to registered processors in batches.
+
+    Candidates are resolved once per concrete record type from each
+    processor's record_types and cached. Within a type, the first
+    registered candidate whose validate accepts the record wins, so
+    specific processors (logs) must come before general ones (text);
+    for strings that check is one precompiled regex search. register
+    places a subclass ahead of its registered base, and takes an
+    explicit position for anything else that must win.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty router."""
+        self.processors: List[DataProcessor] = []
+        self.candidates: Dict[type, Tuple[DataProcessor, ...]] = {}
+        self.routed: Dict[str, int] = {}
+        self.unrouted = 0
+
+    @classmethod
+    def with_defaults(cls) -> "ProcessorRouter":
+        """Return a router with the numeric, log and text processors."""
+        router = cls()
+        router.register(NumericProcessor())
+        router.register(LogProcessor())
+        router.register(TextProcessor())
+        return router
+
+    def register(
+        self,
+        processor: DataProcessor,
+        position: Optional[int] = None
+    ) -> None:
+        """Add a processor at a position in the routing order.
+
+        Without a position it goes just before the first registered
+        processor it subclasses, or last if there is none, so
+        ProcessorRouter.with_defaults() followed by registering a
+        TextProcessor subclass routes text to the subclass.
+        """
+        if position is None:
+            position = next(
+                (index for index, existing in enumerate(self.processors)
+                 if type(processor) is not type(existing)
+                 and isinstance(processor, type(existing))),
+                len(self.processors)
+            )
+        self.processors.insert(position, processor)
+        self.candidates.clear()
+
+    def candidates_for(
+        self,
+        record_type: Type[Any]
+    ) -> Tuple[DataProcessor, ...]:
+        """Return the cached processors that accept a record type."""
+        candidates = self.candidates.get(record_type)
+        if candidates is None:
+            candidates = tuple(
+                processor for processor in self.processors
+                if issubclass(record_type, processor.record_types)
+            )
+            self.candidates[record_type] = candidates
+        return candidates
+
+    def route(self, record: Any) -> Optional[DataProcessor]:
+        """Return the processor for a record, or None if none accepts it."""
+        for processor in self.candidates_for(type(record)):
+            if processor.validate(record):
+                return processor
+        return None
+
+    def group_records(
+        self,
+        records: Iterable[Any]
+    ) -> Tuple[Dict[DataProcessor, List[int]], List[int]]:
+        """Group record positions by processor, plus unrouted positions."""
+        groups: Dict[DataProcessor, List[int]] = {}
+        unrouted: List[int] = []
+        route = self.route
+        for index, record in enumerate(records):
+            processor = route(record)
+            if processor is None:
+                unrouted.append(index)
+            else:
+                groups.setdefault(processor, []).append(index)
+        return groups, unrouted
+
+    def process_batch(self, records: Sequence[Any]) -> List[Optional[str]]:
+        """Process records in input order, one batch call per processor.
+
+        Records no processor accepts yield None in their position.
+        """
+        results: List[Optional[str]] = [None] * len(records)
+        groups, unrouted = self.group_records(records)
+        for processor, indexes in groups.items():
+            outputs = processor.process_batch(
+                [records[index] for index in indexes]
+            )
+            for index, output in zip(indexes, outputs):
+                results[index] = output
+            name = type(processor).__name__
+            self.routed[name] = self.routed.get(name, 0) + len(indexes)
+        self.unrouted += len(unrouted)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return routing counters and cache size."""
+        return {
+            "processors": [type(p).__name__ for p in self.processors],
+            "cached_types": len(self.candidates),
+            "routed": dict(self.routed),
+            "unrouted": self.unrouted
+        }
+
+
 def demonstrate_polymorphism() -> None:
     """Demonstrate polymorphic data processing."""
     print("=== CODE NEXUS - DATA PROCESSOR FOUNDATION ===\n")
@@ -13,63 +13,1095 @@
 
 """Polymorphic Streams - Advanced data streaming system with polymorphism."""
 
+import ast
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from array import array
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import (
+    Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+)
+from functools import lru_cache
+from itertools import compress, islice
+from time import monotonic
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, Deque, Dict, Iterable,
+    Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+NUMPY_AVAILABLE = np is not None
+DEFAULT_WINDOW_SIZE = 1000
+DEFAULT_MICRO_BATCH = 1000
+DEFAULT_SEGMENT_BYTES = 64 << 20
+DEFAULT_INDEX_INTERVAL = 4096
+
+# Log record header: payload length, record offset, CRC32 of the payload.
+RECORD_HEADER = struct.Struct("<IQI")
+# Sparse index entry: record offset, byte position in the segment.
+INDEX_ENTRY = struct.Struct("<QQ")
+# Batches keyed by stream_id or by stream registration position.
+StreamBatches = Mapping[Any, List[Any]]
+# Parsed numbers: a typed array, or Python ints once one overflows it.
+Numbers = Union[array, List[Any]]
+# ParsedBatch column behind each row local of a routing condition.
+ROW_COLUMNS = {"code": "codes", "kind": "labels", "value": "values",
+               "ok": "valid"}
+
+
+def parse_numbers(
+    texts: List[str],
+    typecode: str
+) -> Tuple[Numbers, bytearray]:
+    """Parse the number after the first colon of each text.
+
+    The whole column is converted with one map() call; only if some field
+    fails does it fall back to per-item parsing with validity flags. An
+    integer too large for the typecode turns the column into a list of
+    Python ints rather than being dropped.
+    """
+    convert: Callable[[str], Any] = float if typecode == "d" else int
+    fields = [text.partition(":")[2] for text in texts]
+    try:
+        return (array(typecode, map(convert, fields)),
+                bytearray(b"\x01") * len(fields))
+    except (ValueError, OverflowError):
+        pass
+    values: Numbers = array(typecode)
+    valid = bytearray()
+    for field in fields:
+        try:
+            value = convert(field.partition(":")[0])
+        except ValueError:
+            values.append(0)
+            valid.append(0)
+            continue
+        try:
+            values.append(value)
+        except OverflowError:
+            values = list(values)
+            values.append(value)
+        valid.append(1)
+    return values, valid
+
+
+class LabelIds(Dict[str, int]):
+    """Label-to-id mapping that yields -1 for labels not in the batch."""
+
+    def __missing__(self, key: str) -> int:
+        """Return the id used for absent labels."""
+        return -1
+
+
+class ParsedBatch:
+    """Columnar view of a batch whose columns are parsed on first use.
+
+    codes holds each item's first matching keyword position (0 if none),
+    labels the text before the colon, and values/valid the number after
+    it. keyword_values parses only the rows of one keyword, which is all
+    most aggregations need. Nothing is cached across calls implicitly:
+    build one with DataStream.parse_batch and pass it to several calls to
+    share the work, and do not mutate the batch while it is in use.
+    """
+
+    __slots__ = ("source", "size", "keywords", "typecode", "_lowered",
+                 "_codes", "_labels", "_label_ids", "_values", "_valid",
+                 "_by_keyword")
+
+    def __init__(
+        self,
+        data_batch: List[Any],
+        keywords: Sequence[str],
+        typecode: Optional[str] = None
+    ) -> None:
+        """Wrap a batch; no column is parsed yet."""
+        self.source = data_batch
+        self.size = len(data_batch)
+        self.keywords = tuple(keywords)
+        self.typecode = typecode or "d"
+        self._lowered: Optional[List[str]] = None
+        self._codes: Optional[array] = None
+        self._labels: Optional[List[str]] = None
+        self._label_ids: Optional[Tuple[array, Dict[str, int]]] = None
+        self._values: Optional[Numbers] = None
+        self._valid: Optional[bytearray] = None
+        self._by_keyword: Dict[int, Tuple[Numbers, bytearray]] = {}
+
+    def matches(self, data_batch: List[Any]) -> bool:
+        """Return True if this view was built from data_batch."""
+        return self.source is data_batch and self.size == len(data_batch)
+
+    @property
+    def lowered(self) -> List[str]:
+        """Return the lowercased text of every item."""
+        if self._lowered is None:
+            self._lowered = [str(item).lower() for item in self.source]
+        return self._lowered
+
+    @property
+    def codes(self) -> array:
+        """Return each item's first matching keyword position (0 if none)."""
+        if self._codes is None:
+            lowered = self.lowered
+            codes: List[int] = [0] * self.size
+            for position in range(len(self.keywords), 0, -1):
+                keyword = self.keywords[position - 1]
+                codes = [position if keyword in text else code
+                         for text, code in zip(lowered, codes)]
+            self._codes = array("b", codes)
+        return self._codes
+
+    @property
+    def kinds(self) -> List[str]:
+        """Return each item's first matching keyword ("" if none)."""
+        names = ("",) + self.keywords
+        return [names[code] for code in self.codes]
+
+    @property
+    def labels(self) -> List[str]:
+        """Return the stripped text before the first colon of each item."""
+        if self._labels is None:
+            self._labels = [text.partition(":")[0].strip()
+                            for text in self.lowered]
+        return self._labels
+
+    @property
+    def label_ids(self) -> Tuple[array, Dict[str, int]]:
+        """Return each label interned to an id, and the label-to-id map.
+
+        Labels missing from the batch map to -1.
+        """
+        if self._label_ids is None:
+            ids: Dict[str, int] = LabelIds()
+            column = array("q", [ids.setdefault(label, len(ids))
+                                 for label in self.labels])
+            self._label_ids = (column, ids)
+        return self._label_ids
+
+    @property
+    def values(self) -> Numbers:
+        """Return the number after the first colon of every item."""
+        if self._values is None:
+            self._values, self._valid = parse_numbers(self.lowered,
+                                                      self.typecode)
+        return self._values
+
+    @property
+    def valid(self) -> bytearray:
+        """Return 1 for every item whose number parsed, else 0."""
+        if self._valid is None:
+            self._values, self._valid = parse_numbers(self.lowered,
+                                                      self.typecode)
+        return self._valid
+
+    def keyword_rows(self, position: int) -> List[bool]:
+        """Return, per item, whether its first keyword is position.
+
+        Scans for that keyword alone unless codes were already built.
+        """
+        if self._codes is not None:
+            return [code == position for code in self._codes]
+        keyword = self.keywords[position - 1]
+        earlier = self.keywords[:position - 1]
+        if not earlier:
+            return [keyword in text for text in self.lowered]
+        return [keyword in text and not any(map(text.__contains__, earlier))
+                for text in self.lowered]
+
+    def keyword_texts(self, position: int) -> List[str]:
+        """Return the lowercased items whose first keyword is position."""
+        if self._codes is not None:
+            return list(compress(self.lowered, self.keyword_rows(position)))
+        keyword = self.keywords[position - 1]
+        earlier = self.keywords[:position - 1]
+        if not earlier:
+            return [text for text in self.lowered if keyword in text]
+        return [text for text in self.lowered if keyword in text
+                and not any(map(text.__contains__, earlier))]
+
+    def keyword_values(self, position: int) -> Tuple[Numbers, bytearray]:
+        """Return values and validity for the rows of one keyword only."""
+        parsed = self._by_keyword.get(position)
+        if parsed is None:
+            if self._values is not None and self._valid is not None:
+                rows = self.keyword_rows(position)
+                kept = compress(self._values, rows)
+                parsed = (array(self.typecode, kept)
+                          if isinstance(self._values, array) else list(kept),
+                          bytearray(compress(self._valid, rows)))
+            else:
+                parsed = parse_numbers(self.keyword_texts(position),
+                                       self.typecode)
+            self._by_keyword[position] = parsed
+        return parsed
+
+    def as_numpy(self) -> Tuple[Any, Any, Any]:
+        """Return zero-copy NumPy views of the codes, values and valid.
+
+        Values that overflowed the typecode come back as an object array.
+        """
+        values = self.values
+        return (
+            np.frombuffer(self.codes, dtype=np.int8),
+            np.frombuffer(values, dtype=values.typecode)
+            if isinstance(values, array) else np.array(values, dtype=object),
+            np.frombuffer(self.valid, dtype=np.bool_)
+        )
+
+
+class RunningWindow:
+    """Sliding or tumbling count/time window with O(1) updates.
+
+    Mean and variance use Welford's method (with its inverse on eviction)
+    and min/max come from monotonic deques, so no update re-scans the
+    window. A tumbling window publishes its summary to last_closed and
+    starts over once it fills up or its duration elapses.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = DEFAULT_WINDOW_SIZE,
+        duration: Optional[float] = None,
+        tumbling: bool = False
+    ) -> None:
+        """Initialize window bounds; either bound may be None."""
+        self.size = size
+        self.duration = duration
+        self.tumbling = tumbling
+        self.entries: Deque[Tuple[int, float, float]] = deque()
+        self.minima: Deque[Tuple[int, float]] = deque()
+        self.maxima: Deque[Tuple[int, float]] = deque()
+        self.sequence = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.started_at: Optional[float] = None
+        self.last_closed: Optional[Dict[str, float]] = None
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> None:
+        """Add one value observed at timestamp (defaults to now)."""
+        now = monotonic() if timestamp is None else timestamp
+        if self.tumbling:
+            if self.duration is not None and self.started_at is not None \
+                    and now - self.started_at >= self.duration:
+                self._close()
+            if self.started_at is None:
+                self.started_at = now
+        seq = self.sequence
+        self.sequence += 1
+        self.entries.append((seq, now, value))
+        delta = value - self.mean
+        self.mean += delta / len(self.entries)
+        self.m2 += delta * (value - self.mean)
+        minima = self.minima
+        while minima and minima[-1][1] >= value:
+            minima.pop()
+        minima.append((seq, value))
+        maxima = self.maxima
+        while maxima and maxima[-1][1] <= value:
+            maxima.pop()
+        maxima.append((seq, value))
+        if self.tumbling:
+            if self.size is not None and len(self.entries) >= self.size:
+                self._close()
+        else:
+            self._evict(now)
+
+    def extend(
+        self,
+        values: Iterable[float],
+        timestamp: Optional[float] = None
+    ) -> None:
+        """Add several values sharing one timestamp."""
+        now = monotonic() if timestamp is None else timestamp
+        for value in values:
+            self.add(value, now)
+
+    def _evict(self, now: float) -> None:
+        """Drop entries that fall outside a sliding window."""
+        entries = self.entries
+        while entries and (
+            (self.size is not None and len(entries) > self.size)
+            or (self.duration is not None
+                and entries[0][1] < now - self.duration)
+        ):
+            self._remove_oldest()
+
+    def _remove_oldest(self) -> None:
+        """Remove the oldest entry, reversing its Welford update."""
+        seq, _, value = self.entries.popleft()
+        remaining = len(self.entries)
+        if remaining == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+        else:
+            old_mean = self.mean
+            self.mean -= (value - old_mean) / remaining
+            self.m2 = max(0.0, self.m2 - (value - self.mean)
+                          * (value - old_mean))
+        if self.minima and self.minima[0][0] == seq:
+            self.minima.popleft()
+        if self.maxima and self.maxima[0][0] == seq:
+            self.maxima.popleft()
+
+    def _close(self) -> None:
+        """Publish the current tumbling window and start an empty one."""
+        self.last_closed = self.snapshot()
+        self.entries.clear()
+        self.minima.clear()
+        self.maxima.clear()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.started_at = None
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return count, mean, sample variance, min and max."""
+        count = len(self.entries)
+        return {
+            "count": count,
+            "mean": self.mean,
+            "variance": self.m2 / (count - 1) if count > 1 else 0.0,
+            "min": self.minima[0][1] if self.minima else 0.0,
+            "max": self.maxima[0][1] if self.maxima else 0.0
+        }
+
+
+class HeavyHitters:
+    """Count-min sketch that tracks the k most frequent keys."""
+
+    def __init__(self, k: int = 10, width: int = 1024, depth: int = 4) -> None:
+        """Initialize sketch rows and the candidate table."""
+        self.k = k
+        self.width = width
+        self.rows = [array("q", bytes(8 * width)) for _ in range(depth)]
+        self.candidates: Dict[str, int] = {}
+
+    def add(self, key: str, count: int = 1) -> None:
+        """Count a key and update the top-k candidates."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        first = int.from_bytes(digest[:4], "little")
+        second = int.from_bytes(digest[4:], "little") | 1
+        estimate = -1
+        for seed, row in enumerate(self.rows):
+            idx = (first + seed * second) % self.width
+            row[idx] += count
+            if estimate < 0 or row[idx] < estimate:
+                estimate = row[idx]
+        candidates = self.candidates
+        if key in candidates or len(candidates) < self.k:
+            candidates[key] = estimate
+            return
+        weakest = min(candidates, key=candidates.__getitem__)
+        if estimate > candidates[weakest]:
+            del candidates[weakest]
+            candidates[key] = estimate
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return up to n (key, estimated count) pairs, most frequent first."""
+        ranked = sorted(self.candidates.items(), key=lambda kv: -kv[1])
+        return ranked if n is None else ranked[:n]
+
+
+class CompiledFilter:
+    """Filter expression compiled once into Python and NumPy predicates.
+
+    Expressions read each "label:value" record through a few names: kind
+    is the label, value (or amount) the number, and any other name such
+    as temp stands for the value of records with that label. Supported
+    syntax is comparisons, and/or/not, and string or number literals,
+    e.g. 'temp > 30 or temp < 5' or 'kind == "buy" and amount >= 100'.
+    Labels and string literals are compared in lowercase. Text is only
+    compared with text and only for (in)equality, so 'kind > 5' or
+    'value > "a"' are rejected when compiled rather than failing midway
+    through a batch.
+    """
+
+    FIELDS = {"kind": "kind", "value": "value", "amount": "value"}
+    OPERATORS = {
+        ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=",
+        ast.Gt: ">", ast.GtE: ">="
+    }
+
+    def __init__(self, expression: str) -> None:
+        """Parse and compile the expression."""
+        self.expression = expression
+        try:
+            tree = ast.parse(expression.strip(), mode="eval").body
+        except SyntaxError as e:
+            raise ValueError(f"Invalid filter expression: {e.msg}") from e
+        self.uses_values = False
+        self.source = source = self._python(tree)[0]
+        self.predicate: Callable[[str, Optional[float]], bool] = eval(
+            compile(f"lambda kind, value: bool({source})", "<filter>",
+                    "eval"), {"__builtins__": {"bool": bool}}
+        )
+        self.vector: Optional[Callable[..., Any]] = None
+        if NUMPY_AVAILABLE:
+            try:
+                vector_source = self._vector(tree)
+            except ValueError:
+                vector_source = None
+            if vector_source is not None:
+                self.vector = eval(
+                    compile("lambda label_ids, values, valid, lid: "
+                            + vector_source, "<filter>", "eval"),
+                    {"__builtins__": {}}
+                )
+
+    def mask(self, parsed: ParsedBatch, use_numpy: bool) -> List[bool]:
+        """Evaluate the filter for every record of a parsed batch."""
+        if use_numpy and self.vector is not None:
+            label_ids, lid = parsed.label_ids
+            values = valid = None
+            if self.uses_values:
+                _, values, valid = parsed.as_numpy()
+            result = self.vector(np.frombuffer(label_ids, dtype=np.int64),
+                                 values, valid, lid)
+            return np.broadcast_to(result, parsed.size).tolist()
+        predicate = self.predicate
+        if not self.uses_values:
+            return [predicate(label, None) for label in parsed.labels]
+        return [predicate(label, value if ok else None)
+                for label, value, ok in zip(parsed.labels, parsed.values,
+                                            parsed.valid)]
+
+    def _python(self, node: ast.AST) -> Tuple[str, bool]:
+        """Return Python source for a node and whether it may be None."""
+        if isinstance(node, ast.BoolOp):
+            joiner = " and " if isinstance(node.op, ast.And) else " or "
+            return f"({joiner.join(self._truth(v) for v in node.values)})", \
+                False
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return f"(not {self._truth(node.operand)})", False
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) \
+                and isinstance(node.operand, ast.Constant) \
+                and isinstance(node.operand.value, (int, float)):
+            return repr(-node.operand.value), False
+        if isinstance(node, ast.Compare):
+            self._check_types(node)
+            operands = [self._python(operand)
+                        for operand in [node.left] + node.comparators]
+            chain = operands[0][0]
+            for op, (operand, _) in zip(node.ops, operands[1:]):
+                chain += f" {self._operator(op)} {operand}"
+            guards = [f"{operand} is not None"
+                      for operand, nullable in operands if nullable]
+            return f"({' and '.join(guards + [chain])})", False
+        if isinstance(node, ast.Name):
+            field = self.FIELDS.get(node.id)
+            if field == "kind":
+                return field, False
+            self.uses_values = True
+            if field is not None:
+                return field, True
+            return f"(value if kind == {node.id.lower()!r} else None)", True
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return repr(node.value.lower()), False
+        if isinstance(node, ast.Constant) and \
+                isinstance(node.value, (int, float)):
+            return repr(node.value), False
+        raise ValueError(f"Unsupported filter expression: {self.expression}")
+
+    def _check_types(self, node: ast.Compare) -> None:
+        """Reject comparisons whose operands cannot be compared."""
+        kinds = [self._operand_kind(operand)
+                 for operand in [node.left] + node.comparators]
+        for op, left, right in zip(node.ops, kinds, kinds[1:]):
+            ordered = not isinstance(op, (ast.Eq, ast.NotEq))
+            if {left, right} == {"text", "number"} or \
+                    (ordered and "text" in (left, right)):
+                raise ValueError(
+                    f"Unsupported filter expression: {self.expression}"
+                )
+
+    def _operand_kind(self, node: ast.AST) -> Optional[str]:
+        """Return "text" or "number" for a comparison operand, if known."""
+        if isinstance(node, ast.Name):
+            return "text" if self.FIELDS.get(node.id) == "kind" else "number"
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            node = node.operand
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, str):
+                return "text"
+            if isinstance(node.value, (int, float)):
+                return "number"
+        return None
+
+    def _truth(self, node: ast.AST) -> str:
+        """Return source for a node used as a condition."""
+        if isinstance(node, ast.Name) and node.id not in self.FIELDS:
+            return f"(kind == {node.id.lower()!r})"
+        return self._python(node)[0]
+
+    def _operator(self, op: ast.cmpop) -> str:
+        """Return the source text of a comparison operator."""
+        symbol = self.OPERATORS.get(type(op))
+        if symbol is None:
+            raise ValueError(
+                f"Unsupported filter expression: {self.expression}"
+            )
+        return symbol
+
+    def _vector(self, node: ast.AST) -> str:
+        """Return NumPy mask source for a node, or raise ValueError."""
+        if isinstance(node, ast.BoolOp):
+            joiner = " & " if isinstance(node.op, ast.And) else " | "
+            return f"({joiner.join(self._vector(v) for v in node.values)})"
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return f"(~{self._vector(node.operand)})"
+        if isinstance(node, ast.Name) and node.id not in self.FIELDS:
+            return f"(label_ids == lid[{node.id.lower()!r}])"
+        if isinstance(node, ast.Compare) and len(node.ops) == 1:
+            left, right = node.left, node.comparators[0]
+            symbol = self._operator(node.ops[0])
+            if isinstance(left, (ast.Constant, ast.UnaryOp)):
+                left, right = right, left
+                symbol = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}.get(
+                    symbol, symbol)
+            constant, _ = self._python(right)
+            literal = right.operand if isinstance(right, ast.UnaryOp) \
+                else right
+            is_text = isinstance(literal, ast.Constant) and \
+                isinstance(literal.value, str)
+            is_number = isinstance(literal, ast.Constant) and not is_text
+            if isinstance(left, ast.Name) and left.id == "kind" and \
+                    is_text and symbol in ("==", "!="):
+                return f"(label_ids {symbol} lid[{constant}])"
+            if isinstance(left, ast.Name) and left.id != "kind" and \
+                    is_number:
+                guard = "valid"
+                if left.id not in self.FIELDS:
+                    guard = f"valid & (label_ids == lid[{left.id.lower()!r}])"
+                return f"({guard} & (values {symbol} {constant}))"
+        raise ValueError(f"Expression cannot be vectorized: {self.expression}")
+
+
+@lru_cache(maxsize=256)
+def compile_filter(expression: str) -> CompiledFilter:
+    """Compile a filter expression, caching the result by its text."""
+    return CompiledFilter(expression)
+
+
+@lru_cache(maxsize=128)
+def compile_router(
+    conditions: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], Callable[..., List[List[int]]]]:
+    """Compile conditions into one loop that visits each row once.
+
+    Each condition is a Python expression over the row locals code (the
+    keyword position), kind (the label), value (None if it did not
+    parse) and mask0, mask1, ... (precomputed flags). Returns the column
+    names the loop reads, in argument order, and a function taking the
+    batch size and those columns that returns matching rows per
+    condition.
+    """
+    names: List[str] = []
+    for condition in conditions:
+        for name in compile(condition, "<route>", "eval").co_names:
+            if name not in names:
+                names.append(name)
+    targets: List[str] = [name for name in ("code", "kind", "value")
+                          if name in names]
+    if "value" in targets:
+        targets.append("ok")
+    targets += [name for name in names if name.startswith("mask")]
+    lines = ["def route(size, " + ", ".join(targets) + "):"]
+    for i in range(len(conditions)):
+        lines += [f"    rows{i} = []", f"    append{i} = rows{i}.append"]
+    if targets:
+        lines.append(f"    for index, ({', '.join(targets)},) in "
+                     f"enumerate(zip({', '.join(targets)})):")
+    else:
+        lines.append("    for index in range(size):")
+    if "value" in targets:
+        lines.append("        if not ok: value = None")
+    lines += [f"        if {condition}: append{i}(index)"
+              for i, condition in enumerate(conditions)]
+    rows = ", ".join(f"rows{i}" for i in range(len(conditions)))
+    lines.append(f"    return [{rows}]")
+    namespace: Dict[str, Any] = {"__builtins__": {
+        "enumerate": enumerate, "range": range, "zip": zip
+    }}
+    exec("\n".join(lines), namespace)
+    return tuple(targets), namespace["route"]
+
+
+class RoutedBatch:
+    """Record positions per named criterion, materialized on demand."""
+
+    __slots__ = ("source", "indices")
+
+    def __init__(self, source: List[Any], indices: Dict[str, array]) -> None:
+        """Initialize from the batch and each criterion's matching rows."""
+        self.source = source
+        self.indices = indices
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of matching records per criterion."""
+        return {name: len(rows) for name, rows in self.indices.items()}
+
+    def iter_matches(self, name: str) -> Iterator[Any]:
+        """Lazily yield the records that matched a criterion."""
+        source = self.source
+        for idx in self.indices[name]:
+            yield source[idx]
+
+    def materialize(self, name: str) -> List[Any]:
+        """Return the records that matched a criterion as a list."""
+        return list(self.iter_matches(name))
+
+
+def scan_records(
+    buffer: Any,
+    position: int,
+    end: int
+) -> Iterator[Tuple[int, int, int]]:
+    """Yield (offset, start, stop) for each intact record in a buffer.
+
+    Scanning stops at the first truncated or corrupt record, which is
+    where a crash mid-append leaves the tail of the active segment.
+    """
+    header_size = RECORD_HEADER.size
+    while position + header_size <= end:
+        length, offset, checksum = RECORD_HEADER.unpack_from(buffer,
+                                                             position)
+        start = position + header_size
+        stop = start + length
+        if stop > end or zlib.crc32(buffer[start:stop]) != checksum:
+            return
+        yield offset, start, stop
+        position = stop
+
+
+class StreamLog:
+    """Append-only segmented log of ingested batches.
+
+    Each batch is one record: a length-prefixed, checksummed JSON payload
+    with a sequential offset. Segments roll over at segment_bytes and are
+    named after their first offset; every index_interval bytes a sparse
+    index entry is appended so reads can seek near any offset. Segments
+    are read through mmap. On open, a torn tail in the last segment is
+    truncated and its index rebuilt. Only batches of str items can be
+    logged, since JSON would not round-trip other values faithfully.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        index_interval: int = DEFAULT_INDEX_INTERVAL,
+        sync: bool = False
+    ) -> None:
+        """Open or create the log in directory and recover its tail."""
+        if segment_bytes < 1 or index_interval < 1:
+            raise ValueError("Segment size and index interval must be >= 1")
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.index_interval = index_interval
+        self.sync = sync
+        os.makedirs(directory, exist_ok=True)
+        self.bases = sorted(
+            int(name[:-4]) for name in os.listdir(directory)
+            if name.endswith(".log")
+        ) or [0]
+        self.indexes: Dict[int, Tuple[array, array]] = {}
+        self.next_offset = self._recover(self.bases[-1])
+        self.handle = open(self._path(self.bases[-1], "log"), "ab")
+        self.index_handle = open(self._path(self.bases[-1], "index"), "ab")
+
+    def _path(self, base: int, suffix: str) -> str:
+        """Return the path of a segment's log or index file."""
+        return os.path.join(self.directory, f"{base:020d}.{suffix}")
+
+    def _recover(self, base: int) -> int:
+        """Truncate the active segment to intact records, re-index it."""
+        path = self._path(base, "log")
+        offsets, positions = array("Q"), array("Q")
+        next_offset, valid_end, indexed = base, 0, 0
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb") as reader, \
+                    mmap.mmap(reader.fileno(), 0,
+                              access=mmap.ACCESS_READ) as buffer:
+                for offset, start, stop in scan_records(buffer, 0,
+                                                        len(buffer)):
+                    position = start - RECORD_HEADER.size
+                    if position - indexed >= self.index_interval:
+                        offsets.append(offset)
+                        positions.append(position)
+                        indexed = position
+                    next_offset, valid_end = offset + 1, stop
+        with open(path, "ab") as writer:
+            writer.truncate(valid_end)
+        with open(self._path(base, "index"), "wb") as index:
+            for entry in zip(offsets, positions):
+                index.write(INDEX_ENTRY.pack(*entry))
+        self.indexes[base] = (offsets, positions)
+        self.position = valid_end
+        self.indexed = indexed
+        return next_offset
+
+    @staticmethod
+    def encode(batch: List[Any]) -> bytes:
+        """Serialize a batch of str items into a record payload."""
+        if not all(isinstance(item, str) for item in batch):
+            raise TypeError("Only batches of str items can be logged")
+        return json.dumps(batch, separators=(",", ":")).encode("utf-8")
+
+    def append(self, batch: List[Any]) -> int:
+        """Append one batch as a record and return its offset."""
+        return self.append_payload(self.encode(batch))
+
+    def append_payload(self, payload: bytes) -> int:
+        """Append an already encoded payload and return its offset."""
+        size = RECORD_HEADER.size + len(payload)
+        if self.position and self.position + size > self.segment_bytes:
+            self._roll()
+        offset = self.next_offset
+        if self.position - self.indexed >= self.index_interval:
+            offsets, positions = self.indexes[self.bases[-1]]
+            offsets.append(offset)
+            positions.append(self.position)
+            self.index_handle.write(INDEX_ENTRY.pack(offset, self.position))
+            self.index_handle.flush()
+            self.indexed = self.position
+        self.handle.write(RECORD_HEADER.pack(len(payload), offset,
+                                             zlib.crc32(payload)))
+        self.handle.write(payload)
+        self.handle.flush()
+        if self.sync:
+            os.fsync(self.handle.fileno())
+        self.position += size
+        self.next_offset = offset + 1
+        return offset
+
+    def _roll(self) -> None:
+        """Seal the active segment and start a new one."""
+        for handle in (self.handle, self.index_handle):
+            handle.flush()
+            os.fsync(handle.fileno())
+            handle.close()
+        base = self.next_offset
+        self.bases.append(base)
+        self.indexes[base] = (array("Q"), array("Q"))
+        self.handle = open(self._path(base, "log"), "ab")
+        self.index_handle = open(self._path(base, "index"), "ab")
+        self.position = self.indexed = 0
+
+    def _load_index(self, base: int) -> Tuple[array, array]:
+        """Return a segment's sparse index, reading it on first use."""
+        index = self.indexes.get(base)
+        if index is None:
+            offsets, positions = array("Q"), array("Q")
+            path = self._path(base, "index")
+            if os.path.exists(path):
+                with open(path, "rb") as handle:
+                    for offset, position in INDEX_ENTRY.iter_unpack(
+                            handle.read()):
+                        offsets.append(offset)
+                        positions.append(position)
+            index = self.indexes[base] = (offsets, positions)
+        return index
+
+    def read(self, start_offset: int = 0) -> Iterator[Tuple[int, List[Any]]]:
+        """Yield (offset, batch) for every record from start_offset on."""
+        self.handle.flush()
+        first = max(bisect_right(self.bases, start_offset) - 1, 0)
+        for base in self.bases[first:]:
+            path = self._path(base, "log")
+            size = os.path.getsize(path)
+            if not size:
+                continue
+            offsets, positions = self._load_index(base)
+            slot = bisect_right(offsets, start_offset) - 1
+            position = positions[slot] if slot >= 0 else 0
+            with open(path, "rb") as handle, \
+                    mmap.mmap(handle.fileno(), 0,
+                              access=mmap.ACCESS_READ) as buffer:
+                for offset, start, stop in scan_records(buffer, position,
+                                                        size):
+                    if offset >= start_offset:
+                        yield offset, json.loads(buffer[start:stop])
+
+    def close(self) -> None:
+        """Flush and close the active segment."""
+        for handle in (self.handle, self.index_handle):
+            if not handle.closed:
+                handle.flush()
+                os.fsync(handle.fileno())
+                handle.close()
+
+    def __enter__(self) -> "StreamLog":
+        """Return the open log."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the log."""
+        self.close()
 
 
 class DataStream(ABC):
     """Abstract base class for polymorphic data streams."""
 
+    keywords: Sequence[str] = ()
+    value_typecode: Optional[str] = None
+    # Named criteria as row conditions for compile_router.
+    criterion_sources: Dict[str, str] = {}
+
     def __init__(self, stream_id: str) -> None:
         """Initialize stream with unique identifier."""
         self.stream_id = stream_id
         self.processed_count = 0
+        self.use_numpy = NUMPY_AVAILABLE
+        self.window: Optional[RunningWindow] = None
+        self.log: Optional[StreamLog] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the open log, which stays with the owner."""
+        state = self.__dict__.copy()
+        state["log"] = None
+        return state
+
+    def configure_window(
+        self,
+        size: Optional[int] = DEFAULT_WINDOW_SIZE,
+        duration: Optional[float] = None,
+        tumbling: bool = False
+    ) -> None:
+        """Enable windowed statistics, replacing any current window.
+
+        Windows are off by default because every value then costs a
+        Python-level update.
+        """
+        self.window = RunningWindow(size, duration, tumbling)
+
+    def parse_batch(self, data_batch: List[Any]) -> ParsedBatch:
+        """Return a lazily parsed view of a batch for this stream.
+
+        Pass the result as parsed= to process_batch, filter_data and
+        route_data to share the parsing work between those calls.
+        """
+        return ParsedBatch(data_batch, self.keywords, self.value_typecode)
+
+    def _parsed_for(
+        self,
+        data_batch: List[Any],
+        parsed: Optional[ParsedBatch]
+    ) -> ParsedBatch:
+        """Return parsed if it belongs to data_batch, else a fresh view."""
+        if parsed is None:
+            return self.parse_batch(data_batch)
+        if not parsed.matches(data_batch):
+            raise ValueError("ParsedBatch was built from a different batch")
+        return parsed
 
     @abstractmethod
-    def process_batch(self, data_batch: List[Any]) -> str:
+    def process_batch(
+        self,
+        data_batch: List[Any],
+        parsed: Optional[ParsedBatch] = None
+    ) -> str:
         """Process a batch of data."""
         pass
 
+    def attach_log(self, log: Optional[StreamLog]) -> None:
+        """Record batches passed to ingest in log (None detaches)."""
+        self.log = log
+
+    def ingest(self, data_batch: List[Any]) -> str:
+        """Process a batch, then append it to the attached log, if any.
+
+        The batch is serialized before processing, so a batch the log
+        cannot store fails without touching the stream. Only batches that
+        processed successfully are logged, so replaying the log rebuilds
+        exactly the counters they produced.
+        """
+        payload = None
+        if self.log is not None and data_batch:
+            payload = self.log.encode(data_batch)
+        result = self.process_batch(data_batch)
+        if self.log is not None and payload is not None:
+            self.log.append_payload(payload)
+        return result
+
+    def replay(self, log: StreamLog, start_offset: int = 0) -> int:
+        """Re-process logged batches from start_offset, return next offset.
+
+        Replayed batches are not logged again.
+        """
+        next_offset = start_offset
+        for offset, data_batch in log.read(start_offset):
+            self.process_batch(data_batch)
+            next_offset = offset + 1
+        return next_offset
+
+    def process_stream(
+        self,
+        source: Iterable[Any],
+        batch_size: int = DEFAULT_MICRO_BATCH
+    ) -> Iterator[str]:
+        """Consume an iterable in micro-batches, yielding each summary.
+
+        Only one micro-batch is held at a time, so unbounded sources run
+        in constant memory and leave the same counters as process_batch.
+        Each micro-batch goes through ingest, so it is logged if a log is
+        attached.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        iterator = iter(source)
+        batch = list(islice(iterator, batch_size))
+        while batch:
+            yield self.ingest(batch)
+            batch = list(islice(iterator, batch_size))
+
+    async def aprocess_stream(
+        self,
+        source: AsyncIterable[Any],
+        batch_size: int = DEFAULT_MICRO_BATCH
+    ) -> AsyncIterator[str]:
+        """Async counterpart of process_stream for async iterables."""
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        batch: List[Any] = []
+        async for item in source:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield self.ingest(batch)
+                batch = []
+        if batch:
+            yield self.ingest(batch)
+
     def filter_data(
         self,
         data_batch: List[Any],
-        criteria: Optional[str] = None
+        criteria: Optional[str] = None,
+        parsed: Optional[ParsedBatch] = None
     ) -> List[Any]:
-        """Filter data based on criteria."""
+        """Filter data based on criteria.
+
+        A bare word such as "critical" selects the stream's named
+        criterion; anything else is compiled as a filter expression.
+        """
         if criteria is None:
             return data_batch
-        return [item for item in data_batch if self._matches_criteria(item, criteria)]
+        mask = self._mask_for(self._parsed_for(data_batch, parsed), criteria)
+        return list(compress(data_batch, mask))
+
+    def route_data(
+        self,
+        data_batch: List[Any],
+        criteria: Dict[str, str],
+        parsed: Optional[ParsedBatch] = None
+    ) -> RoutedBatch:
+        """Match a batch against several named criteria at once.
+
+        Every criterion is turned into a row condition and the batch is
+        routed in a single pass over the shared parsed columns. Criteria
+        match exactly the records filter_data would keep.
+        """
+        parsed = self._parsed_for(data_batch, parsed)
+        conditions: List[str] = []
+        masks: List[List[bool]] = []
+        for criterion in criteria.values():
+            if criterion.isidentifier():
+                condition = self.criterion_sources.get(criterion)
+            else:
+                condition = compile_filter(criterion).source
+            if condition is None:
+                condition = f"mask{len(masks)}"
+                masks.append(self._criteria_mask(parsed, criterion))
+            conditions.append(condition)
+        targets, route = compile_router(tuple(conditions))
+        rows = route(parsed.size, *[
+            masks[int(target[4:])] if target.startswith("mask")
+            else getattr(parsed, ROW_COLUMNS[target])
+            for target in targets
+        ])
+        return RoutedBatch(data_batch, {
+            name: array("l", matched)
+            for name, matched in zip(criteria, rows)
+        })
+
+    def _mask_for(self, parsed: ParsedBatch, criteria: str) -> List[bool]:
+        """Return the keep flags for a named criterion or an expression."""
+        if criteria.isidentifier():
+            return self._criteria_mask(parsed, criteria)
+        return compile_filter(criteria).mask(parsed, self.use_numpy)
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return stream statistics."""
-        return {
+        stats: Dict[str, Union[str, int, float]] = {
             "stream_id": self.stream_id,
             "processed_count": self.processed_count
         }
+        if self.window is None:
+            return stats
+        for name, value in self.window.snapshot().items():
+            stats[f"window_{name}"] = value
+        if self.window.last_closed is not None:
+            for name, value in self.window.last_closed.items():
+                stats[f"window_last_{name}"] = value
+        return stats
 
     @abstractmethod
     def _matches_criteria(self, item: Any, criteria: str) -> bool:
         """Check if item matches filtering criteria."""
         pass
 
+    def _criteria_mask(self, parsed: ParsedBatch, criteria: str) -> List[bool]:
+        """Return one keep flag per parsed item for the criteria."""
+        return [self._matches_criteria(item, criteria)
+                for item in parsed.source]
+
 
 class SensorStream(DataStream):
     """Specialized stream for sensor data."""
 
+    keywords = ("temp",)
+    value_typecode = "d"
+    criterion_sources = {
+        "critical": "code != 1 or (value is not None"
+                    " and (value > 30 or value < 5))"
+    }
+
     def __init__(self, stream_id: str) -> None:
         """Initialize sensor stream."""
         super().__init__(stream_id)
         self.stream_type = "Environmental Data"
         self.reading_sum = 0.0
 
-    def process_batch(self, data_batch: List[Any]) -> str:
+    def process_batch(
+        self,
+        data_batch: List[Any],
+        parsed: Optional[ParsedBatch] = None
+    ) -> str:
         """Process sensor batch with aggregation."""
         if not data_batch:
             return "No sensor data to process"
+        parsed = self._parsed_for(data_batch, parsed)
+        temps, valid = parsed.keyword_values(1)
+        if 0 in valid:
+            rows = compress(data_batch, parsed.keyword_rows(1))
+            item = next(islice(rows, valid.index(0), None))
+            raise ValueError(f"Invalid sensor reading: {item}")
+        if self.use_numpy:
+            total = float(np.asarray(temps, dtype=np.float64).sum())
+        else:
+            total = sum(temps)
+        avg_temp = total / len(temps) if temps else 0
         self.processed_count += len(data_batch)
-        temps = [float(str(item).split(":")[1]) for item in data_batch
-                 if "temp" in str(item).lower()]
-        avg_temp = sum(temps) / len(temps) if temps else 0
+        self.reading_sum += total
+        if self.window is not None:
+            self.window.extend(temps)
         return f"{len(data_batch)} readings processed, avg temp: {avg_temp:.1f}°C"
 
     def _matches_criteria(self, item: Any, criteria: str) -> bool:
@@ -84,45 +1116,71 @@ class SensorStream(DataStream):
                     return False
         return True
 
+    def _criteria_mask(self, parsed: ParsedBatch, criteria: str) -> List[bool]:
+        """Flag out-of-range temperatures; other readings always pass.
+
+        Only temperature rows are parsed; their flags are then spread back
+        over the non-temperature rows, which always pass.
+        """
+        if criteria != "critical":
+            return [True] * parsed.size
+        temps, valid = parsed.keyword_values(1)
+        if self.use_numpy:
+            values = np.asarray(temps, dtype=np.float64)
+            critical = np.frombuffer(valid, dtype=np.bool_) & \
+                ((values > 30) | (values < 5))
+            keep = np.ones(parsed.size, dtype=np.bool_)
+            keep[np.array(parsed.keyword_rows(1), dtype=np.bool_)] = critical
+            return keep.tolist()
+        flags = iter([bool(ok) and (temp > 30 or temp < 5)
+                      for temp, ok in zip(temps, valid)])
+        return [next(flags) if row else True for row in parsed.keyword_rows(1)]
+
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return sensor stream statistics."""
         stats = super().get_stats()
         stats["type"] = self.stream_type
+        stats["reading_sum"] = self.reading_sum
         return stats
 
 
 class TransactionStream(DataStream):
     """Specialized stream for financial transactions."""
 
+    keywords = ("buy", "sell")
+    value_typecode = "q"
+    criterion_sources = {"large": "value is not None and value > 100"}
+
     def __init__(self, stream_id: str) -> None:
         """Initialize transaction stream."""
         super().__init__(stream_id)
         self.stream_type = "Financial Data"
         self.net_flow = 0
 
-    def process_batch(self, data_batch: List[Any]) -> str:
+    def process_batch(
+        self,
+        data_batch: List[Any],
+        parsed: Optional[ParsedBatch] = None
+    ) -> str:
         """Process transaction batch with flow analysis."""
         if not data_batch:
             return "No transaction data to process"
         self.processed_count += len(data_batch)
-        buys = sells = 0
-        buy_total = sell_total = 0
-        for item in data_batch:
-            item_str = str(item).lower()
-            if "buy" in item_str:
-                buys += 1
-                try:
-                    buy_total += int(item_str.split(":")[1])
-                except (ValueError, IndexError):
-                    pass
-            elif "sell" in item_str:
-                sells += 1
-                try:
-                    sell_total += int(item_str.split(":")[1])
-                except (ValueError, IndexError):
-                    pass
-        net = buy_total - sell_total
-        self.net_flow = net
+        parsed = self._parsed_for(data_batch, parsed)
+        if self.use_numpy:
+            codes, values, valid = parsed.as_numpy()
+            signed = np.where(codes == 2, -values, values)[(codes > 0) & valid]
+            net = int(signed.sum())
+            flows = signed.tolist()
+        else:
+            flows = [-value if code == 2 else value
+                     for code, value, ok in zip(parsed.codes, parsed.values,
+                                                parsed.valid)
+                     if code and ok]
+            net = sum(flows)
+        self.net_flow += net
+        if self.window is not None:
+            self.window.extend(flows)
         symbol = "+" if net >= 0 else ""
         return f"{len(data_batch)} operations, net flow: {symbol}{net} units"
 
@@ -137,6 +1195,16 @@ class TransactionStream(DataStream):
                 return False
         return True
 
+    def _criteria_mask(self, parsed: ParsedBatch, criteria: str) -> List[bool]:
+        """Flag transactions whose amount exceeds 100."""
+        if criteria != "large":
+            return [True] * parsed.size
+        if self.use_numpy:
+            _, values, valid = parsed.as_numpy()
+            return (valid & (values > 100)).tolist()
+        return [bool(ok) and value > 100
+                for value, ok in zip(parsed.values, parsed.valid)]
+
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return transaction stream statistics."""
         stats = super().get_stats()
@@ -148,19 +1216,43 @@ class TransactionStream(DataStream):
 class EventStream(DataStream):
     """Specialized stream for system events."""
 
+    keywords = ("error",)
+    criterion_sources = {"error": "code == 1"}
+
     def __init__(self, stream_id: str) -> None:
         """Initialize event stream."""
         super().__init__(stream_id)
         self.stream_type = "System Events"
         self.error_count = 0
+        self.heavy_hitters: Optional[HeavyHitters] = None
 
-    def process_batch(self, data_batch: List[Any]) -> str:
+    def track_heavy_hitters(
+        self,
+        k: int = 10,
+        width: int = 1024,
+        depth: int = 4
+    ) -> None:
+        """Start tracking the k most frequent events in a count-min sketch."""
+        self.heavy_hitters = HeavyHitters(k, width, depth)
+
+    def process_batch(
+        self,
+        data_batch: List[Any],
+        parsed: Optional[ParsedBatch] = None
+    ) -> str:
         """Process event batch with error detection."""
         if not data_batch:
             return "No event data to process"
         self.processed_count += len(data_batch)
-        errors = sum(1 for item in data_batch if "error" in str(item).lower())
-        self.error_count = errors
+        parsed = self._parsed_for(data_batch, parsed)
+        errors = len(parsed.keyword_texts(1))
+        self.error_count += errors
+        if self.window is not None:
+            self.window.extend(map(float, parsed.keyword_rows(1)))
+        if self.heavy_hitters is not None:
+            add_event = self.heavy_hitters.add
+            for item, count in Counter(parsed.lowered).items():
+                add_event(item, count)
         return f"{len(data_batch)} events, {errors} error detected"
 
     def _matches_criteria(self, item: Any, criteria: str) -> bool:
@@ -170,6 +1262,12 @@ class EventStream(DataStream):
             return "error" in item_str
         return True
 
+    def _criteria_mask(self, parsed: ParsedBatch, criteria: str) -> List[bool]:
+        """Flag events that mention an error."""
+        if criteria != "error":
+            return [True] * parsed.size
+        return parsed.keyword_rows(1)
+
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return event stream statistics."""
         stats = super().get_stats()
@@ -178,39 +1276,132 @@ class EventStream(DataStream):
         return stats
 
 
+def process_stream_batch(
+    stream: DataStream,
+    data_batch: List[Any]
+) -> Tuple[str, DataStream]:
+    """Process one batch in a worker, returning the updated stream too."""
+    return stream.process_batch(data_batch), stream
+
+
 class StreamProcessor:
     """Orchestrates processing of multiple stream types polymorphically."""
 
     def __init__(self) -> None:
         """Initialize stream processor."""
         self.streams: List[DataStream] = []
+        self.registry: Dict[str, DataStream] = {}
 
     def add_stream(self, stream: DataStream) -> None:
-        """Add a stream to the processor."""
+        """Add a stream to the processor, registering its stream_id."""
+        if stream.stream_id in self.registry:
+            raise ValueError(f"Duplicate stream_id: {stream.stream_id}")
         self.streams.append(stream)
+        self.registry[stream.stream_id] = stream
+
+    def _select_batches(
+        self,
+        batches: StreamBatches
+    ) -> List[Tuple[DataStream, List[Any]]]:
+        """Pair streams with their batch, in registration order.
+
+        Batches are looked up by stream_id; integer keys are still
+        accepted as registration positions.
+        """
+        selected = []
+        for idx, stream in enumerate(self.streams):
+            if stream.stream_id in batches:
+                selected.append((stream, batches[stream.stream_id]))
+            elif idx in batches:
+                selected.append((stream, batches[idx]))
+        return selected
 
-    def process_all_streams(self, batches: Dict[int, List[Any]]) -> List[str]:
+    def process_all_streams(
+        self,
+        batches: StreamBatches,
+        concurrent: bool = False,
+        max_workers: Optional[int] = None
+    ) -> List[str]:
         """Process all streams through polymorphic interface."""
+        if concurrent:
+            completed = dict(self.iter_completed(batches, max_workers))
+            return [completed[stream.stream_id]
+                    for stream, _ in self._select_batches(batches)]
         results = []
-        for idx, stream in enumerate(self.streams):
-            if idx in batches:
-                result = stream.process_batch(batches[idx])
-                results.append(result)
+        for stream, data_batch in self._select_batches(batches):
+            result = stream.process_batch(data_batch)
+            results.append(result)
         return results
 
+    def iter_completed(
+        self,
+        batches: StreamBatches,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield (stream_id, result) as each stream's batch finishes.
+
+        Each stream's batch runs on exactly one worker, so a stream's own
+        state is never updated out of order. With use_processes, the
+        state of the stream returned by the worker is copied back into the
+        registered stream, so existing references to it stay current.
+        """
+        selected = self._select_batches(batches)
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        with executor:
+            futures = {
+                executor.submit(process_stream_batch, stream, data_batch):
+                    stream.stream_id
+                for stream, data_batch in selected
+            }
+            for future in as_completed(futures):
+                stream_id = futures[future]
+                result, updated = future.result()
+                stream = self.registry[stream_id]
+                if updated is not stream:
+                    log = stream.log
+                    stream.__dict__.update(updated.__dict__)
+                    stream.log = log
+                yield stream_id, result
+
     def filter_all_streams(
         self,
-        batches: Dict[int, List[Any]],
+        batches: StreamBatches,
         criteria: str
     ) -> List[List[Any]]:
         """Filter all streams with same criteria."""
         filtered = []
-        for idx, stream in enumerate(self.streams):
-            if idx in batches:
-                result = stream.filter_data(batches[idx], criteria)
-                filtered.append(result)
+        for stream, data_batch in self._select_batches(batches):
+            result = stream.filter_data(data_batch, criteria)
+            filtered.append(result)
         return filtered
 
+    def route_all_streams(
+        self,
+        batches: StreamBatches,
+        criteria: Dict[str, str]
+    ) -> Dict[str, RoutedBatch]:
+        """Route every stream's batch into all matching criteria buckets."""
+        return {
+            stream.stream_id: stream.route_data(data_batch, criteria)
+            for stream, data_batch in self._select_batches(batches)
+        }
+
+    def count_routes(
+        self,
+        routed: Dict[str, RoutedBatch]
+    ) -> Dict[str, int]:
+        """Sum matching record counts per criterion across streams."""
+        totals: Dict[str, int] = {}
+        for batch in routed.values():
+            for name, count in batch.counts().items():
+                totals[name] = totals.get(name, 0) + count
+        return totals
+
 
 def demonstrate_polymorphic_streams() -> None:
     """Demonstrate polymorphic stream processing system."""